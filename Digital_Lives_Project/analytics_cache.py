@@ -0,0 +1,175 @@
+"""Process-wide cache of computed analytics, shared by every session.
+
+Loaded tables, pivots, figures and indexes are keyed explicitly - a namespace
+plus the arguments, which include the data version wherever the value depends
+on a file - so identical views in different sessions are served from one
+computed copy. The cache holds at most `GIG_CACHE_MB` megabytes (sizes are
+estimated on insert) and evicts least-recently-used entries beyond that;
+entries also expire after `GIG_CACHE_TTL` seconds. Concurrent misses on the
+same key compute the value once.
+
+Hit, miss, eviction and expiry counters, overall and per namespace, are
+reported by `stats()` and exported with the instrumentation panel.
+"""
+import os
+import sys
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+
+MAX_BYTES = int(float(os.environ.get("GIG_CACHE_MB", 256)) * 1024 * 1024)
+DEFAULT_TTL = float(os.environ.get("GIG_CACHE_TTL", 3600))
+
+
+# -----------------------------------------------------------------------------
+# SIZE ESTIMATION
+# -----------------------------------------------------------------------------
+def estimate_size(value, _seen=None):
+    """Approximate memory held by `value`, following containers and object attributes."""
+    seen = set() if _seen is None else _seen
+    if id(value) in seen:
+        return 0
+    seen.add(id(value))
+    if hasattr(value, 'memory_usage') and hasattr(value, 'columns'):  # DataFrame
+        return int(value.memory_usage(deep=True).sum())
+    if hasattr(value, 'memory_usage') and hasattr(value, 'dtype'):  # Series, Index
+        return int(value.memory_usage(deep=True))
+    if hasattr(value, 'nbytes') and hasattr(value, 'dtype'):  # ndarray
+        return int(value.nbytes)
+    if hasattr(value, 'to_plotly_json'):  # Figure
+        return estimate_size(value.to_plotly_json(), seen)
+    size = sys.getsizeof(value)
+    if isinstance(value, (str, bytes, int, float, bool, type(None))):
+        return size
+    if isinstance(value, dict):
+        return size + sum(estimate_size(k, seen) + estimate_size(v, seen) for k, v in value.items())
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return size + sum(estimate_size(v, seen) for v in value)
+    fields = list(getattr(value, '__dict__', {}).values())
+    for cls in type(value).__mro__:
+        fields += [getattr(value, name) for name in getattr(cls, '__slots__', ()) if hasattr(value, name)]
+    return size + sum(estimate_size(v, seen) for v in fields)
+
+
+# -----------------------------------------------------------------------------
+# CACHE
+# -----------------------------------------------------------------------------
+class _Entry:
+    __slots__ = ('value', 'size', 'expires')
+
+    def __init__(self, value, size, expires):
+        self.value = value
+        self.size = size
+        self.expires = expires
+
+
+class AnalyticsCache:
+    """Thread-safe LRU cache bounded by estimated bytes, with per-entry TTL."""
+
+    def __init__(self, max_bytes=MAX_BYTES, ttl=DEFAULT_TTL):
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._inflight = {}
+        self._counters = {}
+
+    def _count(self, namespace, event):
+        counters = self._counters.setdefault(namespace, dict.fromkeys(('hits', 'misses', 'evictions', 'expirations'), 0))
+        counters[event] += 1
+
+    def _drop(self, key):
+        entry = self._entries.pop(key)
+        self._bytes -= entry.size
+
+    def _lookup(self, key, now):
+        """The live entry for `key`, or None; call with the lock held."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.expires <= now:
+            self._drop(key)
+            self._count(key[0], 'expirations')
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def get_or_compute(self, key, compute, ttl=None, size=estimate_size):
+        """The cached value for `key` (a tuple starting with its namespace), computing it on a miss."""
+        while True:
+            with self._lock:
+                entry = self._lookup(key, time.monotonic())
+                if entry is not None:
+                    self._count(key[0], 'hits')
+                    return entry.value
+                pending = self._inflight.get(key)
+                if pending is None:
+                    pending = self._inflight[key] = threading.Event()
+                    self._count(key[0], 'misses')
+                    break
+            # Another session is computing this key; wait, then read its result.
+            pending.wait()
+
+        try:
+            value = compute()
+            self._put(key, value, size(value), self.ttl if ttl is None else ttl)
+        finally:
+            with self._lock:
+                del self._inflight[key]
+            pending.set()
+        return value
+
+    def _put(self, key, value, nbytes, ttl):
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+            if nbytes > self.max_bytes:
+                # Never cached; the caller still gets the value.
+                return
+            self._entries[key] = _Entry(value, nbytes, time.monotonic() + ttl)
+            self._bytes += nbytes
+            while self._bytes > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._drop(oldest)
+                self._count(oldest[0], 'evictions')
+
+    def clear(self, prefix=None):
+        """Drop every entry, or those whose namespace starts with `prefix`."""
+        with self._lock:
+            for key in [k for k in self._entries if prefix is None or k[0].startswith(prefix)]:
+                self._drop(key)
+
+    def stats(self):
+        """Overall and per-namespace counters, entry counts and bytes."""
+        with self._lock:
+            namespaces = {name: {**counters, 'entries': 0, 'bytes': 0} for name, counters in self._counters.items()}
+            for key, entry in self._entries.items():
+                namespaces[key[0]]['entries'] += 1
+                namespaces[key[0]]['bytes'] += entry.size
+            totals = {event: sum(c[event] for c in namespaces.values()) for event in ('hits', 'misses', 'evictions', 'expirations')}
+            lookups = totals['hits'] + totals['misses']
+            return {
+                **totals,
+                'hit_ratio': round(totals['hits'] / lookups, 4) if lookups else None,
+                'entries': len(self._entries),
+                'bytes': self._bytes,
+                'max_bytes': self.max_bytes,
+                'namespaces': namespaces,
+            }
+
+
+CACHE = AnalyticsCache()
+
+
+def memoize(namespace, ttl=None, size=estimate_size):
+    """Cache a function's results in `CACHE`, keyed on `namespace` and its (hashable) arguments."""
+    def decorator(fn):
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            key = (namespace, args, tuple(sorted(kwargs.items())))
+            return CACHE.get_or_compute(key, lambda: fn(*args, **kwargs), ttl=ttl, size=size)
+        wrapper.cache_clear = lambda: CACHE.clear(namespace)
+        return wrapper
+    return decorator
@@ -0,0 +1,229 @@
+"""Headless Gig-ness scoring service (plain ASGI, no framework).
+
+    uvicorn api:app --workers 4        # pip install uvicorn
+
+Routes:
+    GET  /health
+    POST /score          {"scores": [u_inc, c_sec, i_dep, a_time, d_med]}
+                         or {"scores": {"Income Uncertainty": 2, ...}}
+    POST /score/batch    {"records": [[...5 scores...], ...]}
+
+Both scoring routes return `total`, `percent`, `classification` and
+`nearest_profile` exactly as the dashboard's Gig-ness tab computes them.
+Single-score requests arriving within a short window are coalesced into one
+vectorized `gigness.score_batch` call; all validation and scoring runs on a
+bounded thread pool. Every pending single score and batch record counts toward
+`MAX_PENDING`; requests beyond it are rejected with 503.
+"""
+import asyncio
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
+import numpy as np
+
+import gigness
+
+MAX_WORKERS = int(os.environ.get("GIG_API_WORKERS", 4))
+MAX_PENDING = int(os.environ.get("GIG_API_MAX_PENDING", 10_000))
+MAX_BATCH_RECORDS = 100_000
+COALESCE_WINDOW = 0.002  # seconds
+COALESCE_MAX = 1024
+
+
+class HTTPError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+# -----------------------------------------------------------------------------
+# SCORING
+# -----------------------------------------------------------------------------
+def _vector(value):
+    """One respondent's scores as a list in `gigness.dimensions` order."""
+    if isinstance(value, dict):
+        try:
+            value = [value[d] for d in gigness.dimensions]
+        except KeyError as exc:
+            raise HTTPError(400, f"missing dimension {exc.args[0]!r}") from None
+    if not isinstance(value, list) or len(value) != len(gigness.dimensions):
+        raise HTTPError(400, f"expected {len(gigness.dimensions)} dimension scores")
+    if not all(isinstance(v, int) and not isinstance(v, bool) for v in value):
+        raise HTTPError(400, "dimension scores must be integers")
+    # Checked here rather than in the batch so one bad request cannot fail a coalesced group.
+    if not all(0 <= v <= gigness.MAX_DIMENSION_SCORE for v in value):
+        raise HTTPError(400, f"dimension scores must lie in 0..{gigness.MAX_DIMENSION_SCORE}")
+    return value
+
+
+def _score_rows(rows):
+    """Score an (n, 5) list/array; blocking, runs on the worker pool."""
+    try:
+        result = gigness.score_batch(np.asarray(rows, dtype=np.int16))
+    except (ValueError, KeyError) as exc:
+        raise HTTPError(400, str(exc)) from None
+    return [
+        {'total': int(t), 'percent': float(p), 'classification': c, 'nearest_profile': n}
+        for t, p, c, n in zip(result['total'], result['percent'], result['classification'], result['nearest_profile'])
+    ]
+
+
+def _score_records(records):
+    """Validate and score a batch request's records; blocking, runs on the worker pool."""
+    rows = [_vector(r) for r in records]
+    return _score_rows(rows) if rows else []
+
+
+class Coalescer:
+    """Group single-score requests into one batch per short time window.
+
+    Identical vectors share a future, so a burst of equal requests is scored once.
+    """
+
+    def __init__(self, executor, window=COALESCE_WINDOW, max_batch=COALESCE_MAX):
+        self._executor = executor
+        self._window = window
+        self._max_batch = max_batch
+        self._pending = {}
+        self._flush_handle = None
+        self.in_flight = 0
+
+    @contextmanager
+    def admit(self, count=1):
+        """Hold `count` places of the `MAX_PENDING` limit; raises 503 when they are not free."""
+        if self.in_flight + count > MAX_PENDING:
+            raise HTTPError(503, "scoring queue is full")
+        self.in_flight += count
+        try:
+            yield
+        finally:
+            self.in_flight -= count
+
+    async def score(self, vector):
+        with self.admit():
+            key = tuple(vector)
+            future = self._pending.get(key)
+            if future is None:
+                future = self._pending[key] = asyncio.get_running_loop().create_future()
+                if len(self._pending) >= self._max_batch:
+                    self._flush()
+                elif self._flush_handle is None:
+                    self._flush_handle = asyncio.get_running_loop().call_later(self._window, self._flush)
+            return await asyncio.shield(future)
+
+    def _flush(self):
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        batch, self._pending = self._pending, {}
+        if batch:
+            asyncio.ensure_future(self._run(batch))
+
+    async def _run(self, batch):
+        loop = asyncio.get_running_loop()
+        try:
+            results = await loop.run_in_executor(self._executor, _score_rows, list(batch))
+        except Exception as exc:
+            for future in batch.values():
+                future.set_exception(exc)
+            return
+        for future, result in zip(batch.values(), results):
+            future.set_result(result)
+
+
+# -----------------------------------------------------------------------------
+# ASGI APPLICATION
+# -----------------------------------------------------------------------------
+class ScoringApp:
+    def __init__(self, max_workers=MAX_WORKERS):
+        self._max_workers = max_workers
+        self._executor = None
+        self._coalescer = None
+
+    def _start(self):
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix="gigness")
+            self._coalescer = Coalescer(self._executor)
+
+    def _stop(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = self._coalescer = None
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] == 'lifespan':
+            await self._lifespan(receive, send)
+            return
+        if scope['type'] != 'http':
+            return
+        self._start()
+        try:
+            status, payload = 200, await self._route(scope, receive)
+        except HTTPError as exc:
+            status, payload = exc.status, {'error': str(exc)}
+        body = json.dumps(payload).encode()
+        await send({
+            'type': 'http.response.start',
+            'status': status,
+            'headers': [(b'content-type', b'application/json'), (b'content-length', str(len(body)).encode())],
+        })
+        await send({'type': 'http.response.body', 'body': body})
+
+    async def _lifespan(self, receive, send):
+        while True:
+            message = await receive()
+            if message['type'] == 'lifespan.startup':
+                self._start()
+                await send({'type': 'lifespan.startup.complete'})
+            elif message['type'] == 'lifespan.shutdown':
+                self._stop()
+                await send({'type': 'lifespan.shutdown.complete'})
+                return
+
+    async def _route(self, scope, receive):
+        method, path = scope['method'], scope['path'].rstrip('/')
+        if path == '/health' and method == 'GET':
+            return {'status': 'ok', 'dimensions': gigness.dimensions}
+        if path == '/score' and method == 'POST':
+            request = await _read_json(receive)
+            return await self._coalescer.score(_vector(request.get('scores')))
+        if path == '/score/batch' and method == 'POST':
+            records = (await _read_json(receive)).get('records')
+            if not isinstance(records, list):
+                raise HTTPError(400, "'records' must be a list")
+            if len(records) > MAX_BATCH_RECORDS:
+                raise HTTPError(413, f"at most {MAX_BATCH_RECORDS} records per batch")
+            # A batch larger than the whole limit is admitted only when nothing else is pending.
+            with self._coalescer.admit(min(len(records), MAX_PENDING)):
+                loop = asyncio.get_running_loop()
+                return {'results': await loop.run_in_executor(self._executor, _score_records, records)}
+        if path in ('/health', '/score', '/score/batch'):
+            raise HTTPError(405, "method not allowed")
+        raise HTTPError(404, "not found")
+
+
+async def _read_json(receive):
+    chunks = []
+    more = True
+    while more:
+        message = await receive()
+        chunks.append(message.get('body', b''))
+        more = message.get('more_body', False)
+    try:
+        request = json.loads(b''.join(chunks) or b'{}')
+    except ValueError:
+        raise HTTPError(400, "request body is not valid JSON") from None
+    if not isinstance(request, dict):
+        raise HTTPError(400, "request body must be a JSON object")
+    return request
+
+
+app = ScoringApp()
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    uvicorn.run("api:app", host="0.0.0.0", port=int(os.environ.get("PORT", 8000)))
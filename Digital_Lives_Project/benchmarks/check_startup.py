@@ -0,0 +1,81 @@
+"""Startup-time check: fail if a cold start of an HTML-only tab misses the target.
+
+Runs app.py once in a fresh interpreter with the Key Findings tab selected and
+checks that (a) the first run finishes within the target and (b) neither pandas
+nor the Plotly figure module was imported on the way. Exits non-zero on failure.
+Cohort summaries are precomputed first, as a deployment would (summaries.py).
+
+CI runs it on every push and pull request (.github/workflows/startup.yml):
+
+    python benchmarks/check_startup.py --target-ms 500
+"""
+import argparse
+import json
+import logging
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+APP_DIR = Path(__file__).resolve().parent.parent
+APP = str(APP_DIR / "app.py")
+
+STARTUP_TARGET_MS = 500
+START_TAB = "Key Findings"
+DEFERRED_MODULES = ("pandas", "figures")
+
+
+def _probe():
+    sys.path.insert(0, str(APP_DIR))
+    logging.disable(logging.WARNING)
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(APP, default_timeout=60)
+    at.session_state["active_tab"] = START_TAB
+    start = time.perf_counter()
+    at.run()
+    elapsed = (time.perf_counter() - start) * 1000
+    if at.exception:
+        raise RuntimeError(at.exception[0].value)
+
+    import startup
+    print(json.dumps({
+        "first_run_ms": round(elapsed, 2),
+        "imported": [m for m in DEFERRED_MODULES if m in sys.modules],
+        "import_profile": startup.import_profile(),
+    }))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--target-ms", type=float, default=STARTUP_TARGET_MS)
+    parser.add_argument("--probe", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.probe:
+        _probe()
+        return 0
+
+    subprocess.run([sys.executable, "summaries.py"], check=True, capture_output=True, cwd=APP_DIR)
+    out = subprocess.run(
+        [sys.executable, __file__, "--probe"],
+        check=True, capture_output=True, text=True, cwd=APP_DIR,
+    ).stdout
+    result = json.loads(out.strip().splitlines()[-1])
+
+    failures = []
+    if result["first_run_ms"] > args.target_ms:
+        failures.append(f"cold start {result['first_run_ms']} ms exceeds target {args.target_ms} ms")
+    if result["imported"]:
+        failures.append(f"deferred modules imported at startup: {', '.join(result['imported'])}")
+
+    print(f"cold start of '{START_TAB}': {result['first_run_ms']} ms (target {args.target_ms} ms)")
+    for name, ms in result["import_profile"].items():
+        print(f"  import {name:<10} {ms:>8.2f} ms")
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
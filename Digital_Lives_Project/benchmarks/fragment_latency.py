@@ -0,0 +1,89 @@
+"""Slider latency: full-script rerun vs. the Gig-ness calculator fragment.
+
+Streamlit's AppTest always reruns the whole script, so the fragment rerun is
+measured by running `views.gigness_calculator` on its own, which is exactly the
+code a fragment rerun executes.
+
+    python benchmarks/fragment_latency.py --runs 30
+"""
+import argparse
+import json
+import logging
+import statistics
+import sys
+import time
+from pathlib import Path
+
+APP_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(APP_DIR))
+
+from streamlit.testing.v1 import AppTest  # noqa: E402
+
+SLIDER_VALUES = [0, 1, 2]
+
+
+def _calculator_script():
+    import streamlit as st
+    import views
+    from theme import DEFAULT_THEME
+
+    st.set_page_config(layout="wide")
+    views.gigness_calculator(DEFAULT_THEME)
+
+
+def _time_slider_moves(at, runs):
+    samples = []
+    for i in range(runs):
+        at.slider(key="u_inc").set_value(SLIDER_VALUES[i % len(SLIDER_VALUES)])
+        start = time.perf_counter()
+        at.run()
+        samples.append((time.perf_counter() - start) * 1000)
+        if at.exception:
+            raise RuntimeError(at.exception[0].value)
+    return samples
+
+
+def full_rerun(runs):
+    at = AppTest.from_file(str(APP_DIR / "app.py"), default_timeout=60).run()
+    at.radio(key="active_tab").set_value("Gig-ness Index").run()
+    return _time_slider_moves(at, runs)
+
+
+def fragment_rerun(runs):
+    at = AppTest.from_function(_calculator_script, default_timeout=60).run()
+    return _time_slider_moves(at, runs)
+
+
+def summarize(samples):
+    return {
+        "runs": len(samples),
+        "median_ms": round(statistics.median(samples), 2),
+        "mean_ms": round(statistics.fmean(samples), 2),
+        "p95_ms": round(statistics.quantiles(samples, n=100, method='inclusive')[94] if len(samples) > 1 else samples[0], 2),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--json", action="store_true", help="print the result as JSON")
+    args = parser.parse_args(argv)
+
+    logging.disable(logging.WARNING)
+    result = {
+        "full_rerun": summarize(full_rerun(args.runs)),
+        "fragment_rerun": summarize(fragment_rerun(args.runs)),
+    }
+    result["speedup"] = round(result["full_rerun"]["median_ms"] / result["fragment_rerun"]["median_ms"], 2)
+
+    if args.json:
+        print(json.dumps(result, indent=2))
+    else:
+        for name in ("full_rerun", "fragment_rerun"):
+            r = result[name]
+            print(f"{name:<15} median {r['median_ms']:>8.2f} ms   p95 {r['p95_ms']:>8.2f} ms")
+        print(f"speedup         {result['speedup']}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,252 @@
+"""Offline load and render-latency benchmarks for the dashboard.
+
+Drives app.py headlessly with Streamlit's AppTest and writes a JSON report:
+
+    cold_start    fresh interpreter: first full run (imports included), a rerun
+                  and the per-module import profile
+    tabs          per-tab rerun latency and element payload bytes
+    slider        Gig-ness slider latency, full rerun vs. fragment
+    memory        peak RSS of the process and current RSS growth per live session
+    hot_paths     CSS injection, figure building and table rendering in isolation
+    analytics_cache  hit/miss counters and bytes of the shared cache after the above
+
+    python benchmarks/run_benchmarks.py --runs 20 --output benchmarks/report.json
+"""
+import argparse
+import gc
+import json
+import logging
+import platform
+import resource
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+APP_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(APP_DIR))
+
+import fragment_latency  # noqa: E402
+from streamlit.testing.v1 import AppTest  # noqa: E402
+
+APP = str(APP_DIR / "app.py")
+TIMEOUT = 60
+
+
+def _stats(samples):
+    return fragment_latency.summarize(samples)
+
+
+def _time(fn, runs):
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def _peak_rss_kb():
+    # ru_maxrss is KiB on Linux, bytes on macOS.
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss // 1024 if sys.platform == "darwin" else rss
+
+
+def _current_rss_kb():
+    """Resident set size right now (Linux), or None where /proc is unavailable."""
+    try:
+        with open("/proc/self/statm") as statm:
+            pages = int(statm.read().split()[1])
+    except OSError:
+        return None
+    return pages * resource.getpagesize() // 1024
+
+
+def app_payload_bytes(at):
+    """Serialized size of every element an AppTest run rendered, main area and sidebar."""
+    return payload_bytes(at.main) + payload_bytes(at.sidebar)
+
+
+def payload_bytes(node):
+    """Serialized size of every element proto below an AppTest tree node."""
+    total = 0
+    proto = getattr(node, "proto", None)
+    if proto is not None and hasattr(proto, "ByteSize"):
+        total += proto.ByteSize()
+    for child in getattr(node, "children", {}).values():
+        total += payload_bytes(child)
+    return total
+
+
+def _check(at):
+    if at.exception:
+        raise RuntimeError(at.exception[0].value)
+    return at
+
+
+# -----------------------------------------------------------------------------
+# BENCHMARKS
+# -----------------------------------------------------------------------------
+def cold_start():
+    """Run the probe below in a fresh interpreter so imports are really cold."""
+    out = subprocess.run(
+        [sys.executable, __file__, "--cold-start-probe"],
+        check=True, capture_output=True, text=True, cwd=APP_DIR,
+    ).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def _cold_start_probe():
+    logging.disable(logging.WARNING)
+    start = time.perf_counter()
+    at = AppTest.from_file(APP, default_timeout=TIMEOUT)
+    _check(at.run())
+    first_run = time.perf_counter() - start
+    start = time.perf_counter()
+    _check(at.run())
+    import startup
+    print(json.dumps({
+        "first_run_ms": round(first_run * 1000, 2),
+        "second_run_ms": round((time.perf_counter() - start) * 1000, 2),
+        "peak_rss_kb": _peak_rss_kb(),
+        "import_profile": startup.import_profile(),
+    }))
+
+
+def tabs(runs):
+    at = _check(AppTest.from_file(APP, default_timeout=TIMEOUT).run())
+    result = {}
+    for tab in at.radio(key="active_tab").options:
+        at.radio(key="active_tab").set_value(tab)
+        _check(at.run())
+        samples = _time(lambda: _check(at.run()), runs)
+        result[tab] = {**_stats(samples), "payload_bytes": app_payload_bytes(at)}
+    return result
+
+
+def slider(runs):
+    result = {
+        "full_rerun": _stats(fragment_latency.full_rerun(runs)),
+        "fragment_rerun": _stats(fragment_latency.fragment_rerun(runs)),
+    }
+    result["speedup"] = round(result["full_rerun"]["median_ms"] / result["fragment_rerun"]["median_ms"], 2)
+    return result
+
+
+def memory(sessions):
+    """Current RSS growth per session over `sessions` live sessions, each visiting every tab."""
+    gc.collect()
+    before = _current_rss_kb()
+    apps = []
+    for _ in range(sessions):
+        at = _check(AppTest.from_file(APP, default_timeout=TIMEOUT).run())
+        for tab in at.radio(key="active_tab").options:
+            at.radio(key="active_tab").set_value(tab)
+            _check(at.run())
+        apps.append(at)
+    gc.collect()
+    after = _current_rss_kb()
+    return {
+        "sessions": sessions,
+        "peak_rss_kb": _peak_rss_kb(),
+        # Current, not peak, RSS: a high-water mark set earlier would hide the growth.
+        "rss_per_session_kb": None if before is None else round((after - before) / sessions, 1),
+    }
+
+
+def hot_paths(runs):
+    import data
+    import figures
+    from analytics_cache import CACHE
+    import theme
+    from theme import THEMES, theme_style
+
+    name = next(iter(THEMES))
+    result = {}
+
+    theme_style.cache_clear()
+    result["css_compile"] = _stats(_time(lambda: (theme_style.cache_clear(), theme_style(name)), runs))
+    result["css_per_rerun"] = {**_stats(_time(lambda: theme_style(name), runs)), "bytes": len(theme_style(name))}
+    result["css_stylesheet_bytes"] = len(theme.STYLESHEET)
+
+    builders = {
+        "radar": lambda: figures.radar(name, [1, 1, 1, 1, 0]),
+        "autonomy_bar": lambda: figures.autonomy_bar(name),
+        "income_lines": lambda: figures.income_lines(name),
+    }
+    for label, build in builders.items():
+        cold = _time(lambda: (CACHE.clear("figure:"), build()), runs)
+        warm = _time(build, runs)
+        result[f"figure_{label}"] = {
+            "cold": _stats(cold),
+            "cached": _stats(warm),
+            "json_bytes": len(build().to_json()),
+        }
+
+    at = _check(AppTest.from_function(_table_script, default_timeout=TIMEOUT).run())
+    result["autonomy_table"] = {
+        **_stats(_time(lambda: _check(at.run()), runs)),
+        "payload_bytes": app_payload_bytes(at),
+        "rows": data.autonomy_grid().num_rows,
+    }
+    return result
+
+
+def _table_script():
+    import streamlit as st
+    import data
+
+    st.dataframe(data.autonomy_grid(), hide_index=True)
+
+
+# -----------------------------------------------------------------------------
+# ENTRY POINT
+# -----------------------------------------------------------------------------
+def run(runs, sessions):
+    logging.disable(logging.WARNING)
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "runs": runs,
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        },
+        "cold_start": cold_start(),
+        "tabs": tabs(runs),
+        "slider": slider(runs),
+        "hot_paths": hot_paths(runs),
+        # Last, so the peak RSS reflects everything above as well.
+        "memory": memory(sessions),
+        # Shared across every session above: sizes the cache budget.
+        "analytics_cache": _cache_stats(),
+    }
+
+
+def _cache_stats():
+    from analytics_cache import CACHE
+
+    return CACHE.stats()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=20, help="timed reruns per measurement")
+    parser.add_argument("--sessions", type=int, default=10, help="sessions for the memory benchmark")
+    parser.add_argument("--output", default=str(APP_DIR / "benchmarks" / "report.json"))
+    parser.add_argument("--cold-start-probe", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.cold_start_probe:
+        _cold_start_probe()
+        return
+
+    report = run(args.runs, args.sessions)
+    Path(args.output).write_text(json.dumps(report, indent=2) + "\n")
+    print(f"wrote {args.output}")
+    for tab, r in report["tabs"].items():
+        print(f"  {tab:<22} median {r['median_ms']:>8.2f} ms  {r['payload_bytes']:>8} B")
+    print(f"  cold start {report['cold_start']['first_run_ms']} ms, slider speedup {report['slider']['speedup']}x")
+
+
+if __name__ == "__main__":
+    main()
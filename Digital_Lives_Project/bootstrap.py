@@ -0,0 +1,106 @@
+"""Vectorized percentile bootstrap for group means.
+
+All resamples of all groups are drawn in one array operation, in one of two
+equivalent ways:
+
+    answer counts   survey answers take few distinct values, and a resample's
+                    mean depends only on how often it drew each value, so the
+                    counts are drawn from a multinomial - (resamples, groups,
+                    levels) at once, whatever the number of respondents
+    gathered values otherwise each response position draws an index within its
+                    own group and `np.add.reduceat` sums every group's slice of
+                    every resample; resamples are drawn in blocks when
+                    `resamples x responses` exceeds MAX_BLOCK_ELEMENTS
+
+The answer-count path costs the same for any number of respondents; the
+gathering path costs `resamples x responses` draws, so `max_resamples` caps
+the resample count an interactive caller should request for continuous data.
+The generator is seeded, so the same data always gives the same intervals.
+"""
+import numpy as np
+
+DEFAULT_RESAMPLES = 10_000
+DEFAULT_CONFIDENCE = 0.95
+SEED = 20240601
+
+# Resampled values held in memory at once by the gathering path.
+MAX_BLOCK_ELEMENTS = 1 << 24
+# Draws the gathering path may make for one interactive request (about a second).
+MAX_GATHERED_DRAWS = 50_000_000
+
+
+def _level_means(rng, level_values, level_groups, level_counts, counts, resamples):
+    """Resampled means from multinomial draws of each group's distinct values."""
+    n_groups = len(counts)
+    starts = np.concatenate([[0], np.cumsum(np.bincount(level_groups, minlength=n_groups))[:-1]])
+    position = np.arange(len(level_values)) - starts[level_groups]
+    width = position.max() + 1
+    # Padded (group, level) tables; padding has probability 0.
+    levels = np.zeros((n_groups, width))
+    pvals = np.zeros((n_groups, width))
+    levels[level_groups, position] = level_values
+    pvals[level_groups, position] = level_counts / counts[level_groups]
+    draws = rng.multinomial(counts, pvals, size=(resamples, n_groups))
+    return (draws * levels).sum(axis=2) / counts
+
+
+def _gathered_means(rng, values, counts, resamples):
+    """Resampled means from index draws within each group's slice of `values`."""
+    offsets = np.concatenate([[0], np.cumsum(counts)[:-1]])
+    low = np.repeat(offsets, counts)
+    high = low + np.repeat(counts, counts)
+    means = np.empty((resamples, len(counts)))
+    block = max(1, MAX_BLOCK_ELEMENTS // len(values))
+    for start in range(0, resamples, block):
+        size = min(block, resamples - start)
+        picks = rng.integers(low, high, size=(size, len(values)))
+        means[start:start + size] = np.add.reduceat(values[picks], offsets, axis=1) / counts
+    return means
+
+
+def _levels(values, groups):
+    """Values and groups sorted by group, then value; each group's level starts and sizes; whether to use them."""
+    # Runs of equal values are a group's levels.
+    order = np.lexsort((values, groups))
+    values, groups = values[order], groups[order]
+    first = np.flatnonzero(np.r_[True, (groups[1:] != groups[:-1]) | (values[1:] != values[:-1])])
+    level_counts = np.diff(np.r_[first, len(values)])
+    widest = np.bincount(groups[first]).max()
+    return values, groups, first, level_counts, widest * (groups[-1] + 1) < len(values)
+
+
+def max_resamples(values, groups):
+    """Largest resample count within MAX_GATHERED_DRAWS, or None when the answer-count path applies."""
+    values = np.asarray(values, dtype=float)
+    groups = np.asarray(groups, dtype=np.intp)
+    if _levels(values, groups)[-1]:
+        return None
+    return MAX_GATHERED_DRAWS // len(values)
+
+
+def group_means_ci(values, groups, resamples=DEFAULT_RESAMPLES, confidence=DEFAULT_CONFIDENCE, seed=SEED):
+    """(mean, low, high, n) arrays per group for `values` labelled by integer `groups` codes 0..g-1.
+
+    Each group is resampled with replacement at its own size; the interval is
+    the percentile interval of the resampled means.
+    """
+    values = np.asarray(values, dtype=float)
+    groups = np.asarray(groups, dtype=np.intp)
+    if values.shape != groups.shape or values.ndim != 1 or not len(values):
+        raise ValueError("values and groups must be non-empty 1-d arrays of the same length")
+    if not 0 < confidence < 1:
+        raise ValueError("confidence must lie between 0 and 1")
+    counts = np.bincount(groups)
+    if (counts == 0).any():
+        raise ValueError("every group code must have at least one value")
+
+    values, groups, first, level_counts, by_level = _levels(values, groups)
+    rng = np.random.default_rng(seed)
+    if by_level:
+        means = _level_means(rng, values[first], groups[first], level_counts, counts, resamples)
+    else:
+        means = _gathered_means(rng, values, counts, resamples)
+
+    tail = (1 - confidence) / 2
+    ci_low, ci_high = np.quantile(means, [tail, 1 - tail], axis=0)
+    return np.bincount(groups, weights=values) / counts, ci_low, ci_high, counts
@@ -0,0 +1,386 @@
+"""Data-access layer for the dashboard.
+
+Every dataset is a named table with a typed schema. A table is read from the
+first source found in the cohort's data directory:
+
+    <name>.parquet          (memory-mapped, only the schema's columns)
+    <name>.csv
+    gig.sqlite, table <name>
+
+A cohort may also hold per-worker `autonomy_answers`, which replace the
+curated autonomy comparison with one aggregated from the answers (see
+`autonomy_grid`), and an `earnings_log.csv`; the income chart (then daily
+rather than weekly) and the income volatility scores are streamed from it
+(see `ingest`).
+
+The data directory is `GIG_DATA_DIR` (default: ./data next to this file); each
+subdirectory holding its own tables is an extra cohort. Frames are cached
+process-wide in the analytics cache, keyed on the source file's path, mtime and
+size, so editing a file invalidates its entry and every session shares one
+read-only copy.
+"""
+import os
+import sqlite3
+from contextlib import closing
+from pathlib import Path
+
+from analytics_cache import memoize
+from gigness import dimensions
+from startup import timed_import
+
+# pandas and ingest are imported inside the readers so that importing this
+# module (e.g. to list cohorts) stays cheap; see startup.py.
+
+DATA_DIR = Path(os.environ.get("GIG_DATA_DIR", Path(__file__).parent / "data"))
+SQLITE_NAME = "gig.sqlite"
+EARNINGS_LOG_NAME = "earnings_log.csv"
+# A cohort's chat and SMS exports (see `messages`); never a cohort of its own.
+MESSAGES_DIR_NAME = "messages"
+# Tables without a fallback; a subdirectory lacking one is not offered as a cohort.
+REQUIRED_TABLES = ('profile_scores', 'workers')
+
+# -----------------------------------------------------------------------------
+# SCHEMAS
+# -----------------------------------------------------------------------------
+SCHEMAS = {
+    'workers': {
+        'key': 'string',
+        'title': 'string',
+        'Experience': 'string',
+        'Structure': 'string',
+        'Schedule': 'string',
+        'Income': 'string',
+        'Autonomy': 'string',
+        'Gig Score': 'string',
+    },
+    'profile_scores': {
+        'profile': 'string',
+        **{d: 'int8' for d in dimensions},
+    },
+    'autonomy_comparison': {
+        'Dimension': 'category',
+        'cohort': 'category',
+        'answer': 'string',
+    },
+    'autonomy_perception': {
+        'category': 'category',
+        'cohort': 'category',
+        'value': 'float64',
+    },
+    'income_weekly': {
+        'series': 'category',
+        'week': 'category',
+        'earnings': 'float64',
+    },
+    # Optional: per-worker autonomy answers (see `autonomy_grid`).
+    'autonomy_answers': {
+        'worker_id': 'string',
+        'cohort': 'category',
+        'Dimension': 'category',
+        'answer': 'category',
+    },
+    # Optional: per-worker autonomy perception scores (see `autonomy_perception`).
+    'autonomy_responses': {
+        'worker_id': 'string',
+        'cohort': 'category',
+        'category': 'category',
+        'value': 'float64',
+    },
+    # Optional: per-respondent Gig-ness scores (see `respondents`).
+    'respondents': {
+        'worker_id': 'string',
+        **{d: 'int8' for d in dimensions},
+    },
+}
+
+
+class DataSourceError(LookupError):
+    """No source file for a table, or a source that does not match its schema."""
+
+
+# -----------------------------------------------------------------------------
+# SOURCE RESOLUTION
+# -----------------------------------------------------------------------------
+def cohort_dir(cohort=None):
+    return DATA_DIR if cohort is None else DATA_DIR / cohort
+
+
+def cohorts():
+    """Available cohorts: None for the top-level data directory, then subdirectories holding the required tables."""
+    found = [None]
+    if DATA_DIR.is_dir():
+        found += sorted(
+            p.name for p in DATA_DIR.iterdir()
+            if p.is_dir() and not p.name.startswith('.') and p.name != MESSAGES_DIR_NAME
+            and all(has_table(name, p.name) for name in REQUIRED_TABLES)
+        )
+    return found
+
+
+def _source(name, cohort):
+    base = cohort_dir(cohort)
+    for suffix in ('.parquet', '.csv'):
+        path = base / f"{name}{suffix}"
+        if path.is_file():
+            return path
+    path = base / SQLITE_NAME
+    if path.is_file():
+        return path
+    raise DataSourceError(f"no source for table {name!r} in {base}")
+
+
+def has_table(name, cohort=None):
+    """Whether a source for `name` exists (a SQLite file must also contain the table)."""
+    try:
+        path = _source(name, cohort)
+    except DataSourceError:
+        return False
+    if path.name != SQLITE_NAME:
+        return True
+    with closing(sqlite3.connect(f"file:{path}?mode=ro", uri=True)) as conn:
+        found = conn.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (name,)).fetchone()
+    return found is not None
+
+
+def table_version(name, cohort=None):
+    """Cache key for a table: (path, mtime_ns, size) of its source file."""
+    path = _source(name, cohort)
+    stat = path.stat()
+    return str(path), stat.st_mtime_ns, stat.st_size
+
+
+def data_version(*names, cohort=None):
+    """Combined version of several tables, e.g. to key a cached figure."""
+    return tuple(table_version(name, cohort) for name in names)
+
+
+# -----------------------------------------------------------------------------
+# READERS
+# -----------------------------------------------------------------------------
+def _read_source(path, name):
+    pd = timed_import("pandas")
+
+    columns = list(SCHEMAS[name])
+    if path.suffix == '.parquet':
+        return pd.read_parquet(path, columns=columns, memory_map=True)
+    if path.suffix == '.csv':
+        return pd.read_csv(path, usecols=columns, dtype=str, keep_default_na=False)
+    quoted = ", ".join('"' + c.replace('"', '""') + '"' for c in columns)
+    with closing(sqlite3.connect(f"file:{path}?mode=ro", uri=True)) as conn:
+        return pd.read_sql_query(f'SELECT {quoted} FROM "{name}"', conn)
+
+
+@memoize("table")
+def _load(name, path, mtime_ns, size):
+    try:
+        frame = _read_source(Path(path), name)
+        frame = frame.astype(SCHEMAS[name])
+    except (KeyError, ValueError, sqlite3.Error) as exc:
+        raise DataSourceError(f"{path}: cannot read table {name!r}: {exc}") from exc
+    return frame
+
+
+def load_table(name, cohort=None):
+    """The typed DataFrame for table `name`. Treat the result as read-only."""
+    if name not in SCHEMAS:
+        raise KeyError(f"unknown table {name!r}")
+    return _load(name, *table_version(name, cohort))
+
+
+# -----------------------------------------------------------------------------
+# DOMAIN ACCESSORS
+# -----------------------------------------------------------------------------
+def reference_profiles(cohort=None):
+    """Reference Gig-ness profiles as {profile: [score per dimension]}."""
+    frame = load_table('profile_scores', cohort)
+    return dict(zip(frame['profile'], frame[dimensions].to_numpy().tolist()))
+
+
+def respondents(cohort=None):
+    """Per-respondent dimension scores, or None if the cohort has no respondents table."""
+    if not has_table('respondents', cohort):
+        return None
+    return load_table('respondents', cohort)
+
+
+@memoize("profile_index")
+def _profile_index(cohort, version):
+    from profile_index import ProfileIndex
+
+    index = ProfileIndex(reference_profiles(cohort))
+    frame = load_table('respondents', cohort)
+    return index.add(frame[dimensions].to_numpy())
+
+
+def profile_index(cohort=None):
+    """ProfileIndex of the cohort's respondents against its reference profiles, or None."""
+    if not has_table('respondents', cohort):
+        return None
+    return _profile_index(cohort, data_version('profile_scores', 'respondents', cohort=cohort))
+
+
+@memoize("autonomy_comparison")
+def _autonomy_comparison(cohort, version):
+    frame = load_table('autonomy_comparison', cohort)
+    table = frame.pivot(index='Dimension', columns='cohort', values='answer')
+    table = table.loc[frame['Dimension'].unique(), frame['cohort'].unique()]
+    table.columns = table.columns.astype(str).rename(None)
+    return table.reset_index().astype({'Dimension': str})
+
+
+def autonomy_comparison(cohort=None):
+    """Dimension-by-cohort table of autonomy answers, in file order. Treat as read-only."""
+    return _autonomy_comparison(cohort, table_version('autonomy_comparison', cohort))
+
+
+@memoize("autonomy_counts")
+def _autonomy_counts(cohort, version):
+    pd = timed_import("pandas")
+
+    frame = load_table('autonomy_answers', cohort)
+    # Grouping on the categorical codes; observed=True skips empty combinations.
+    counts = frame.groupby(['Dimension', 'cohort', 'answer'], observed=True, sort=False).size()
+    totals = counts.groupby(level=['Dimension', 'cohort'], observed=True, sort=False).transform('sum')
+    return pd.DataFrame({'n': counts, 'share': counts / totals}).reset_index()
+
+
+def autonomy_counts(cohort=None):
+    """Answer counts and within-group shares per (Dimension, cohort, answer), or None without answers."""
+    if not has_table('autonomy_answers', cohort):
+        return None
+    return _autonomy_counts(cohort, table_version('autonomy_answers', cohort))
+
+
+@memoize("autonomy_grid")
+def _autonomy_grid(cohort, version):
+    pa = timed_import("pyarrow")
+
+    counts = autonomy_counts(cohort)
+    if counts is None:
+        return pa.Table.from_pandas(autonomy_comparison(cohort), preserve_index=False)
+    # The most common answer of each group, labelled with its share.
+    top = counts.sort_values('n', ascending=False, kind='stable').drop_duplicates(['Dimension', 'cohort'])
+    top = top.assign(label=top['answer'].astype(str) + " (" + (top['share'] * 100).round().astype(int).astype(str) + "%)")
+    table = top.pivot(index='Dimension', columns='cohort', values='label')
+    table = table.loc[counts['Dimension'].unique(), counts['cohort'].unique()]
+    table.index = table.index.astype(str)
+    table.columns = table.columns.astype(str).rename(None)
+    return pa.Table.from_pandas(table.reset_index(), preserve_index=False)
+
+
+def autonomy_grid(cohort=None):
+    """The autonomy comparison as an Arrow table: modal answers per dimension and cohort
+    when the cohort has per-worker answers, else the curated comparison."""
+    version = data_version('autonomy_answers' if has_table('autonomy_answers', cohort) else 'autonomy_comparison', cohort=cohort)
+    return _autonomy_grid(cohort, version)
+
+
+@memoize("autonomy_detail")
+def _autonomy_detail(cohort, version, dimension):
+    pa = timed_import("pyarrow")
+
+    counts = autonomy_counts(cohort)
+    rows = counts[counts['Dimension'] == dimension].drop(columns='Dimension')
+    rows = rows.sort_values(['cohort', 'answer']).astype({'cohort': str, 'answer': str})
+    return pa.Table.from_pandas(rows, preserve_index=False)
+
+
+def autonomy_detail(cohort, dimension):
+    """Arrow table of every answer's count and share per cohort for one dimension."""
+    return _autonomy_detail(cohort, table_version('autonomy_answers', cohort), dimension)
+
+
+@memoize("autonomy_perception")
+def _autonomy_perception(cohort, version, resamples, confidence):
+    pd = timed_import("pandas")
+    bootstrap = timed_import("bootstrap")
+
+    frame = load_table('autonomy_responses', cohort)
+    grouped = frame.groupby(['cohort', 'category'], observed=True, sort=False)
+    mean, low, high, n = bootstrap.group_means_ci(frame['value'], grouped.ngroup(), resamples, confidence)
+    keys = grouped.size().index
+    return pd.DataFrame({
+        'category': keys.get_level_values('category'),
+        'cohort': keys.get_level_values('cohort'),
+        'value': mean, 'low': low, 'high': high, 'n': n,
+    })
+
+
+def autonomy_perception(cohort=None, resamples=None, confidence=None):
+    """Autonomy perception score per category and cohort.
+
+    From per-worker responses, when the cohort has them, as means with
+    seeded bootstrap `low`/`high` interval bounds and the response count `n`;
+    otherwise the curated point values.
+    """
+    if not has_table('autonomy_responses', cohort):
+        return load_table('autonomy_perception', cohort)
+    bootstrap = timed_import("bootstrap")
+    return _autonomy_perception(
+        cohort, table_version('autonomy_responses', cohort),
+        resamples or bootstrap.DEFAULT_RESAMPLES, confidence or bootstrap.DEFAULT_CONFIDENCE,
+    )
+
+
+@memoize("autonomy_resample_limit")
+def _autonomy_resample_limit(cohort, version):
+    bootstrap = timed_import("bootstrap")
+
+    frame = load_table('autonomy_responses', cohort)
+    groups = frame.groupby(['cohort', 'category'], observed=True, sort=False).ngroup()
+    return bootstrap.max_resamples(frame['value'], groups)
+
+
+def autonomy_resample_limit(cohort=None):
+    """Most bootstrap resamples `autonomy_perception` should be asked for interactively, or None for no limit."""
+    if not has_table('autonomy_responses', cohort):
+        return None
+    return _autonomy_resample_limit(cohort, table_version('autonomy_responses', cohort))
+
+
+def autonomy_perception_version(cohort=None):
+    """Cache key for `autonomy_perception`: its responses or curated table."""
+    name = 'autonomy_responses' if has_table('autonomy_responses', cohort) else 'autonomy_perception'
+    return data_version(name, cohort=cohort)
+
+
+def earnings_log(cohort=None):
+    """Path of the cohort's earnings log, or None."""
+    path = cohort_dir(cohort) / EARNINGS_LOG_NAME
+    return path if path.is_file() else None
+
+
+def income_version(cohort=None):
+    """Cache key for `weekly_income`: the ingested log extent, or the table version."""
+    log = earnings_log(cohort)
+    if log is not None:
+        import ingest
+        return str(log), ingest.aggregates_for(log).offset
+    return data_version('income_weekly', cohort=cohort)
+
+
+def weekly_income(cohort=None):
+    """Weekly earnings per series, from the earnings log when there is one."""
+    log = earnings_log(cohort)
+    if log is not None:
+        import ingest
+        return ingest.aggregates_for(log).weekly_earnings()
+    return load_table('income_weekly', cohort)
+
+
+def daily_income(cohort=None):
+    """Mean earnings per series and day from the earnings log, or None without a log."""
+    log = earnings_log(cohort)
+    if log is None:
+        return None
+    import ingest
+    return ingest.aggregates_for(log).daily_earnings()
+
+
+def income_volatility(cohort=None):
+    """Per-profile earnings dispersion and Income Uncertainty score, or None without a log."""
+    log = earnings_log(cohort)
+    if log is None:
+        return None
+    import ingest
+    return ingest.aggregates_for(log).per_profile()
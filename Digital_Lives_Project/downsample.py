@@ -0,0 +1,88 @@
+"""Server-side downsampling of long time series for plotting.
+
+A chart only has so many horizontal pixels, so sending more than a point or two
+per pixel wastes websocket bandwidth and browser time without changing what is
+drawn. `downsample` reduces a series to a fixed point budget:
+
+    min/max bucketing   keeps each bucket's extremes, so spikes survive; O(n),
+                        fully vectorized, used as a pre-filter on very long series
+    LTTB                Largest-Triangle-Three-Buckets (Steinarsson, 2013) picks
+                        the visually most significant point per bucket
+
+All functions return indices into the input, so x may be datetimes.
+"""
+import numpy as np
+
+# Series longer than this multiple of the budget are min/max-filtered before LTTB.
+PREFILTER_FACTOR = 4
+
+
+def minmax_indices(y, buckets):
+    """Indices of the minimum and maximum of `y` in each of `buckets` equal-count buckets."""
+    y = np.asarray(y, dtype=float)
+    n = len(y)
+    if n <= 2 * buckets:
+        return np.arange(n)
+    size = -(-n // buckets)
+    # Fewer buckets when `size` overshoots, so the padding only fills the last bucket's tail.
+    buckets = -(-n // size)
+    padded = np.full(buckets * size, np.nan)
+    padded[:n] = y
+    rows = padded.reshape(buckets, size)
+    offsets = np.arange(buckets) * size
+    found = np.concatenate([offsets + np.nanargmin(rows, axis=1), offsets + np.nanargmax(rows, axis=1), [0, n - 1]])
+    return np.unique(found)
+
+
+def lttb_indices(x, y, points):
+    """Indices of the `points` samples chosen by Largest-Triangle-Three-Buckets."""
+    x = _as_float(x)
+    y = np.asarray(y, dtype=float)
+    n = len(x)
+    if points >= n or points < 3:
+        return np.arange(n)
+
+    # Interior points split into points - 2 buckets; the ends are always kept.
+    edges = np.linspace(1, n - 1, points - 1).astype(np.int64)
+    # Each bucket's centroid stands in for the next selected point.
+    sums_x = np.add.reduceat(x[1:n - 1], edges[:-1] - 1)
+    sums_y = np.add.reduceat(y[1:n - 1], edges[:-1] - 1)
+    counts = np.diff(edges)
+    next_x = np.append(sums_x / counts, x[-1])[1:]
+    next_y = np.append(sums_y / counts, y[-1])[1:]
+
+    selected = np.empty(points, dtype=np.int64)
+    selected[0], selected[-1] = 0, n - 1
+    a = 0
+    for i in range(points - 2):
+        lo, hi = edges[i], edges[i + 1]
+        bx, by = x[lo:hi], y[lo:hi]
+        area = np.abs((x[a] - next_x[i]) * (by - y[a]) - (x[a] - bx) * (next_y[i] - y[a]))
+        a = selected[i + 1] = lo + int(area.argmax())
+    return selected
+
+
+def downsample(x, y, points):
+    """Indices of at most `points` samples that preserve the shape of the series."""
+    n = len(y)
+    if n <= points:
+        return np.arange(n)
+    keep = np.arange(n)
+    if n > PREFILTER_FACTOR * points:
+        keep = minmax_indices(y, PREFILTER_FACTOR * points // 2)
+    return keep[lttb_indices(np.asarray(x)[keep], np.asarray(y)[keep], points)]
+
+
+def window(x, start=None, end=None):
+    """Slice of sorted `x` lying within [start, end] (either bound may be None)."""
+    x = np.asarray(x)
+    lo = 0 if start is None else np.searchsorted(x, np.asarray(start).astype(x.dtype), side='left')
+    hi = len(x) if end is None else np.searchsorted(x, np.asarray(end).astype(x.dtype), side='right')
+    return slice(int(lo), int(hi))
+
+
+def _as_float(x):
+    x = np.asarray(x)
+    if np.issubdtype(x.dtype, np.datetime64):
+        x = x.astype('datetime64[ns]').astype(np.int64)
+    return x.astype(float)
@@ -0,0 +1,444 @@
+"""Static export of the dashboard.
+
+Renders every tab in both themes through the real app (headlessly, with
+Streamlit's AppTest) and converts the rendered elements to plain HTML, with the
+Plotly specs embedded. The bundle needs no Python at serving time:
+
+    python export_static.py --output dist
+    python -m http.server -d dist
+
+    dist/index.html                 redirects to the first tab of the default theme
+    dist/<theme>/<tab>.html         one page per theme and tab
+    dist/assets/                    plotly.min.js, dashboard.css, export.css, dashboard.js
+    dist/manifest.json              pages, themes and the data versions exported
+
+Widgets are dropped, except that the tab bar and the theme switch become links
+and the Gig-ness calculator's sliders become range inputs scored in the browser
+(`dashboard.js`) with the weights and thresholds of the cohort's index spec.
+"""
+import argparse
+import html
+import json
+import logging
+import re
+import textwrap
+import time
+from pathlib import Path
+
+APP_DIR = Path(__file__).resolve().parent
+APP = str(APP_DIR / "app.py")
+TIMEOUT = 60
+
+WIDGET_TYPES = {
+    'button', 'checkbox', 'color_picker', 'date_input', 'download_button', 'multiselect',
+    'number_input', 'radio', 'selectbox', 'select_slider', 'slider', 'text_area', 'text_input',
+    'time_input', 'toggle',
+}
+ALERT_TYPES = {'error', 'warning', 'info', 'success', 'exception'}
+
+
+def slug(text):
+    return re.sub(r'[^a-z0-9]+', '-', text.lower()).strip('-')
+
+
+# -----------------------------------------------------------------------------
+# MARKDOWN
+# -----------------------------------------------------------------------------
+# Covers what the dashboard writes: headings, rules, bullet lists, paragraphs,
+# emphasis, inline code and raw HTML blocks.
+_INLINE = [
+    (re.compile(r'`([^`]+)`'), r'<code>\1</code>'),
+    (re.compile(r'\*\*(.+?)\*\*'), r'<strong>\1</strong>'),
+    (re.compile(r'(?<![*\w])\*(?!\s)(.+?)(?<!\s)\*(?![*\w])'), r'<em>\1</em>'),
+]
+
+
+def _inline(text, allow_html):
+    text = text if allow_html else html.escape(text, quote=False)
+    for pattern, replacement in _INLINE:
+        text = pattern.sub(replacement, text)
+    return text
+
+
+def markdown(text, allow_html=False):
+    """Render the Markdown subset used by the dashboard to HTML."""
+    out, paragraph, items = [], [], []
+
+    def flush():
+        if paragraph:
+            out.append(f'<p>{_inline(" ".join(paragraph), allow_html)}</p>')
+            paragraph.clear()
+        if items:
+            out.append('<ul>' + ''.join(f'<li>{_inline(item, allow_html)}</li>' for item in items) + '</ul>')
+            items.clear()
+
+    for block in re.split(r'\n\s*\n', textwrap.dedent(text).strip()):
+        lines = [line.strip() for line in block.splitlines()]
+        if allow_html and lines[0].startswith('<'):
+            flush()
+            out.append('\n'.join(lines))
+            continue
+        for line in lines:
+            heading = re.match(r'(#{1,6})\s+(.*)', line)
+            if heading or re.fullmatch(r'-{3,}|\*{3,}', line):
+                flush()
+                if heading:
+                    level = len(heading.group(1))
+                    out.append(f'<h{level}>{_inline(heading.group(2), allow_html)}</h{level}>')
+                else:
+                    out.append('<hr>')
+            elif line.startswith(('- ', '* ')):
+                if paragraph:
+                    flush()
+                items.append(line[2:])
+            else:
+                if items:
+                    flush()
+                paragraph.append(line)
+        flush()
+    return '\n'.join(out)
+
+
+# -----------------------------------------------------------------------------
+# ELEMENT CONVERSION
+# -----------------------------------------------------------------------------
+class PageRenderer:
+    """Converts one AppTest element tree to HTML."""
+
+    def __init__(self, theme, tab, links, dimensions):
+        from theme import THEMES
+
+        self.theme = theme
+        self.tab = tab
+        self.links = links
+        self.themes = list(THEMES)
+        self.dimensions = set(dimensions)
+        self.plots = 0
+
+    def render(self, node):
+        kind = getattr(node, 'type', None)
+        method = getattr(self, f'_{kind}', None)
+        if method is not None:
+            return method(node)
+        if kind in ALERT_TYPES:
+            return f'<div class="alert alert-{kind}">{markdown(node.value)}</div>'
+        if kind in WIDGET_TYPES:
+            return ''
+        return self._children(node)
+
+    def _children(self, node):
+        return '\n'.join(filter(None, (self.render(child) for child in getattr(node, 'children', {}).values())))
+
+    # --- blocks ---
+    def _flex_container(self, node):
+        children = list(getattr(node, 'children', {}).values())
+        if children and all(getattr(c, 'type', None) == 'column' for c in children):
+            columns = [(c.weight or 1, self._children(c)) for c in children]
+            if not any(body for _, body in columns):
+                return ''  # e.g. a row of dropped widgets
+            return '<div class="columns">' + '\n'.join(
+                f'<div class="column" style="flex: {weight:g}">{body}</div>' for weight, body in columns
+            ) + '</div>'
+        body = self._children(node)
+        return f'<div class="block">{body}</div>' if body else ''
+
+    def _expander(self, node):
+        expanded = ' open' if node.proto.expanded else ''
+        summary = _inline(node.label, allow_html=False)
+        return f'<details class="expander"{expanded}><summary>{summary}</summary>{self._children(node)}</details>'
+
+    # --- elements ---
+    def _markdown(self, node):
+        body = node.proto.body
+        if body.lstrip().startswith('<style'):
+            return ''  # the theme block; the export ships its own stylesheet
+        return markdown(body, node.proto.allow_html)
+
+    def _caption(self, node):
+        return f'<div class="caption">{markdown(node.proto.body, node.proto.allow_html)}</div>'
+
+    def _title(self, node):
+        return f'<h1>{html.escape(node.value)}</h1>'
+
+    def _header(self, node):
+        return f'<h2>{html.escape(node.value)}</h2>'
+
+    def _subheader(self, node):
+        return f'<h3>{html.escape(node.value)}</h3>'
+
+    def _metric(self, node):
+        proto = node.proto
+        delta = ''
+        if proto.delta:
+            arrow = {'UP': '↑ ', 'DOWN': '↓ '}.get(proto.MetricDirection.Name(proto.direction), '')
+            color = proto.MetricColor.Name(proto.color).lower()
+            delta = f'<div class="metric-delta delta-{color}">{arrow}{html.escape(proto.delta)}</div>'
+        return (
+            f'<div class="metric" data-label="{html.escape(proto.label)}">'
+            f'<div class="metric-label">{html.escape(proto.label)}</div>'
+            f'<div class="metric-value">{html.escape(proto.body)}</div>{delta}</div>'
+        )
+
+    def _progress(self, node):
+        return f'<div class="progress"><div style="width: {node.proto.value}%"></div></div>'
+
+    def _table(self, node):
+        return self._frame(node.value)
+
+    def _dataframe(self, node):
+        return self._frame(node.value)
+
+    def _frame(self, frame):
+        import pandas as pd
+
+        show_index = not isinstance(frame.index, pd.RangeIndex)
+        return frame.to_html(index=show_index, border=0, classes='table', na_rep='')
+
+    def _plotly_chart(self, node):
+        self.plots += 1
+        spec = node.proto.spec.replace('</', '<\\/')
+        return (
+            f'<div class="plot" id="plot-{self.plots}"></div>'
+            f'<script type="application/json" data-plot="plot-{self.plots}">{spec}</script>'
+        )
+
+    def _radio(self, node):
+        if node.key == 'active_tab':
+            return self.links['tabs']
+        if list(node.options) == self.themes:
+            return self.links['themes']
+        return ''
+
+    def _slider(self, node):
+        # Only the Gig-ness calculator's sliders stay interactive.
+        if node.label not in self.dimensions:
+            return ''
+        return (
+            f'<label class="calc-slider">{html.escape(node.label)} <output>{node.value}</output>'
+            f'<input type="range" data-dimension="{html.escape(node.label)}" min="{node.min:g}" max="{node.max:g}" '
+            f'step="{node.step:g}" value="{node.value:g}"></label>'
+        )
+
+
+# -----------------------------------------------------------------------------
+# BUNDLE
+# -----------------------------------------------------------------------------
+EXPORT_CSS = """\
+body.stApp { margin: 0; font-family: "Source Sans Pro", system-ui, sans-serif; display: flex; min-height: 100vh; }
+aside[data-testid="stSidebar"] { width: 18rem; flex: none; padding: 1.5rem; background: var(--secondary-bg); }
+main { flex: 1; min-width: 0; padding: 2rem 3rem; }
+.columns { display: flex; gap: 1rem; align-items: flex-start; }
+.column { min-width: 0; }
+.links { display: flex; flex-wrap: wrap; gap: 0.5rem; margin: 1rem 0; }
+.links a { padding: 0.4rem 0.9rem; border-radius: 8px; border: 1px solid var(--border-color); color: var(--text-color); text-decoration: none; }
+.links a[aria-current="page"] { background: #3b82f6; border-color: #3b82f6; color: #ffffff; }
+.metric { margin: 0.5rem 0 1rem; }
+.metric-label { font-size: 0.85rem; opacity: 0.8; }
+.metric-value { font-size: 2rem; }
+.delta-green { color: #10b981; } .delta-red { color: #ef4444; } .delta-gray { color: #9ca3af; }
+.alert { padding: 0.75rem 1rem; border-radius: 8px; margin: 0.5rem 0; }
+.alert p { margin: 0; }
+.alert-info { background: rgba(59, 130, 246, 0.15); }
+.alert-success { background: rgba(16, 185, 129, 0.15); }
+.alert-warning { background: rgba(251, 191, 36, 0.15); }
+.alert-error, .alert-exception { background: rgba(239, 68, 68, 0.15); }
+.caption { font-size: 0.85rem; opacity: 0.75; }
+.progress { height: 0.5rem; border-radius: 4px; background: var(--border-color); overflow: hidden; }
+.progress > div { height: 100%; background: #3b82f6; }
+.table { border-collapse: collapse; width: 100%; }
+.table th, .table td { border-bottom: 1px solid var(--border-color); padding: 0.4rem 0.6rem; text-align: left; color: var(--text-color); }
+.expander { border: 1px solid var(--border-color); border-radius: 8px; padding: 0.5rem 1rem; margin: 1rem 0; }
+.calc-slider { display: block; margin: 0.75rem 0; }
+.calc-slider input { display: block; width: 100%; }
+@media (max-width: 768px) { body.stApp, .columns { flex-direction: column; } aside[data-testid="stSidebar"] { width: auto; } }
+"""
+
+EXPORT_JS = """\
+// Draws the embedded Plotly specs and scores the Gig-ness calculator client-side.
+(function () {
+  var config = JSON.parse(document.getElementById('gig-config').textContent);
+  var plots = {};
+  document.querySelectorAll('script[data-plot]').forEach(function (script) {
+    var spec = JSON.parse(script.textContent);
+    var div = document.getElementById(script.dataset.plot);
+    plots[script.dataset.plot] = spec;
+    Plotly.newPlot(div, spec.data, spec.layout, {responsive: true, displaylogo: false});
+  });
+
+  var sliders = Array.prototype.slice.call(document.querySelectorAll('input[data-dimension]'));
+  if (!sliders.length) return;
+
+  function inline(text) {
+    return text.replace(/\\*\\*(.+?)\\*\\*/g, '<strong>$1</strong>');
+  }
+
+  function score() {
+    var scores = config.dimensions.map(function (d) {
+      var input = sliders.find(function (s) { return s.dataset.dimension === d; });
+      return input ? Number(input.value) : 0;
+    });
+    sliders.forEach(function (s) { s.previousElementSibling.textContent = s.value; });
+    var total = scores.reduce(function (sum, s, i) { return sum + s * config.weights[i]; }, 0);
+    var percent = (total - config.min_score) / (config.max_score - config.min_score) * 100;
+    var label = config.classifications.find(function (c) { return percent >= c[0]; })[1];
+
+    var metric = document.querySelector('.metric[data-label="' + config.total_label + '"]');
+    if (metric) {
+      metric.querySelector('.metric-value').textContent = total + '/' + config.max_score;
+      var delta = metric.querySelector('.metric-delta');
+      if (delta) delta.textContent = '↑ ' + percent.toFixed(1) + '%';
+      var alert = metric.parentElement.querySelector('.alert');
+      if (alert) {
+        var shown = config.alerts[label] || ['info', 'Classification: **' + label + '**'];
+        alert.className = 'alert alert-' + shown[0];
+        alert.innerHTML = '<p>' + inline(shown[1]) + '</p>';
+      }
+    }
+    Object.keys(plots).forEach(function (id) {
+      var index = plots[id].data.findIndex(function (t) { return t.name === config.user_trace; });
+      if (index >= 0) Plotly.restyle(id, {r: [scores]}, [index]);
+    });
+  }
+  sliders.forEach(function (s) { s.addEventListener('input', score); });
+})();
+"""
+
+PAGE = """\
+<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>{tab} · The Gig Economy That Isn't</title>
+<link rel="stylesheet" href="../assets/dashboard.css">
+<link rel="stylesheet" href="../assets/export.css">
+<style>:root {{ {variables} }}</style>
+<script src="../assets/plotly.min.js"></script>
+</head>
+<body class="stApp">
+<aside data-testid="stSidebar">
+{sidebar}
+</aside>
+<main>
+{main}
+</main>
+<script id="gig-config" type="application/json">{config}</script>
+<script src="../assets/dashboard.js"></script>
+</body>
+</html>
+"""
+
+
+def _links(items, current):
+    links = []
+    for label, href in items:
+        current_page = ' aria-current="page"' if label == current else ''
+        links.append(f'<a href="{href}"{current_page}>{html.escape(label)}</a>')
+    return f'<nav class="links">{"".join(links)}</nav>'
+
+
+def _calculator_config(spec):
+    import figures
+    import index_spec
+    import views
+
+    index = index_spec.compile_spec(spec)
+    return json.dumps({
+        'dimensions': list(index.names),
+        'weights': index.weights.tolist(),
+        'min_score': index.min_total,
+        'max_score': index.max_total,
+        'classifications': [list(t) for t in spec.thresholds],
+        'alerts': views.CLASSIFICATION_ALERTS,
+        'total_label': "Total Gig-ness Score",
+        'user_trace': figures.user_trace([0] * len(index.names)).name,
+    })
+
+
+def _run(at):
+    at.run()
+    if at.exception:
+        raise RuntimeError(at.exception[0].value)
+    return at
+
+
+def export(output, cohort=None):
+    """Write the bundle to `output`; returns the manifest."""
+    import plotly.offline
+    from streamlit.testing.v1 import AppTest
+
+    import data
+    import index_spec
+    import theme as theme_module
+    import views
+    from theme import THEMES
+
+    output = Path(output)
+    assets = output / "assets"
+    assets.mkdir(parents=True, exist_ok=True)
+    (assets / "plotly.min.js").write_text(plotly.offline.get_plotlyjs(), encoding="utf-8")
+    (assets / "dashboard.css").write_text(theme_module.STYLESHEET, encoding="utf-8")
+    (assets / "export.css").write_text(EXPORT_CSS, encoding="utf-8")
+    (assets / "dashboard.js").write_text(EXPORT_JS, encoding="utf-8")
+    spec = index_spec.for_cohort(cohort)
+    config = _calculator_config(spec).replace('</', '<\\/')
+
+    tab_files = {title: f"{render.__name__.removeprefix('render_')}.html" for title, render in views.TABS.items()}
+    pages = []
+    for theme in THEMES:
+        at = _run(AppTest.from_file(APP, default_timeout=TIMEOUT))
+        next(r for r in at.sidebar.radio if list(r.options) == list(THEMES)).set_value(theme)
+        if cohort is not None:
+            at.sidebar.selectbox[0].set_value(cohort)
+        for tab, filename in tab_files.items():
+            at.radio(key="active_tab").set_value(tab)
+            _run(at)
+            links = {
+                'tabs': _links([(t, f) for t, f in tab_files.items()], tab),
+                'themes': _links([(name, f"../{slug(name)}/{filename}") for name in THEMES], theme),
+            }
+            renderer = PageRenderer(theme, tab, links, spec.dimension_names)
+            page = PAGE.format(
+                tab=html.escape(tab),
+                variables=theme_module.theme_variables(theme),
+                sidebar=renderer.render(at.sidebar),
+                main=renderer.render(at.main),
+                config=config,
+            )
+            path = output / slug(theme) / filename
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(page, encoding="utf-8")
+            pages.append({'theme': theme, 'tab': tab, 'path': str(path.relative_to(output)), 'bytes': len(page.encode())})
+
+    first = pages[0]['path']
+    (output / "index.html").write_text(
+        f'<!DOCTYPE html><meta charset="utf-8"><meta http-equiv="refresh" content="0; url={first}">'
+        f'<a href="{first}">The Gig Economy That Isn\'t</a>\n',
+        encoding="utf-8",
+    )
+    manifest = {
+        'generated': time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        'cohort': cohort,
+        'themes': list(THEMES),
+        'tabs': list(tab_files),
+        'data_versions': {name: list(data.table_version(name, cohort)[1:]) for name in data.SCHEMAS if data.has_table(name, cohort)},
+        'pages': pages,
+    }
+    (output / "manifest.json").write_text(json.dumps(manifest, indent=2) + "\n", encoding="utf-8")
+    return manifest
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--output", default=str(APP_DIR / "dist"))
+    parser.add_argument("--cohort", default=None, help="cohort subdirectory to export (default: the study sample)")
+    args = parser.parse_args(argv)
+
+    logging.disable(logging.WARNING)
+    manifest = export(args.output, args.cohort)
+    total = sum(p['bytes'] for p in manifest['pages'])
+    print(f"wrote {len(manifest['pages'])} pages ({total / 1024:.0f} KiB) to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,227 @@
+"""Plotly figure factory.
+
+Figures depend only on the theme and the chart data, so they are built once per
+(theme, cohort, data version) and shared by every session through the
+process-wide analytics cache (see `analytics_cache`). The data version is the source files' mtimes (see
+`data.data_version`), so editing a data file rebuilds the affected figures.
+Cached figures must be treated as read-only; the radar chart copies its cached
+base before adding the per-interaction user trace.
+"""
+import numpy as np
+import plotly.graph_objects as go
+
+import data
+import downsample
+import index_spec
+from analytics_cache import memoize
+from gigness import dimensions
+from theme import THEMES
+
+# Long series are downsampled to about one point per horizontal pixel of a
+# half-width chart, and drawn with WebGL once the figure holds this many points.
+PLOT_WIDTH_PX = 800
+WEBGL_THRESHOLD = 1000
+
+# Known series keep their established colours; anything new cycles through these.
+FALLBACK_COLORS = ['#a855f7', '#fbbf24', '#14b8a6', '#f97316', '#ec4899']
+PROFILE_COLORS = {'Zanzibar': '#3b82f6', 'Supplemental': '#10b981', 'Dependent': '#ef4444'}
+COHORT_COLORS = {'Zanzibar': '#3b82f6', 'Dependent Gig': '#ef4444'}
+INCOME_LINES = {
+    'Formal Job (Stable)': dict(color='#10b981', dash='dot', width=2),
+    'Zanzibar Informal (Volatile)': dict(color='#3b82f6', width=4),
+    'Dependent Gig (Stagnant)': dict(color='#ef4444', width=4),
+}
+
+
+def _color(colors, name, i):
+    return colors.get(name, FALLBACK_COLORS[i % len(FALLBACK_COLORS)])
+
+
+def _layout(theme, **extra):
+    palette = THEMES[theme]
+    return dict(
+        paper_bgcolor=palette['bg_color'],
+        font=dict(color=palette['text_color']),
+        **extra
+    )
+
+
+# -----------------------------------------------------------------------------
+# GIG-NESS RADAR
+# -----------------------------------------------------------------------------
+@memoize("figure:radar_base")
+def _radar_base(theme, cohort, version, spec):
+    palette = THEMES[theme]
+    index = index_spec.compile_spec(spec)
+    fig = go.Figure()
+    # Pre-defined profiles, on the spec's axes; dimensions a profile has no score for are left open.
+    for i, (name, values) in enumerate(data.reference_profiles(cohort).items()):
+        scores = dict(zip(dimensions, values))
+        r = [scores.get(axis) for axis in index.names]
+        label = name
+        if None not in r:
+            label = f'{name} ({index.score_one(r)[0]:g}/{index.max_total:g})'
+        fig.add_trace(go.Scatterpolar(r=r, theta=index.names, name=label, line=dict(color=_color(PROFILE_COLORS, name, i), width=2, dash='dot')))
+
+    fig.update_layout(**_layout(
+        theme,
+        polar=dict(
+            bgcolor=palette['secondary_bg'],
+            radialaxis=dict(gridcolor=palette['chart_grid'], tickfont=dict(color=palette['text_color']), range=[min(index.mins.min(), 0), index.maxs.max() + 0.5]),
+            angularaxis=dict(gridcolor=palette['chart_grid'], tickfont=dict(color=palette['text_color']))
+        ),
+        legend=dict(font=dict(color=palette['text_color'])),
+        margin=dict(t=40, b=40)
+    ))
+    return fig
+
+
+def radar_base(theme, cohort=None, spec=index_spec.DEFAULT):
+    return _radar_base(theme, cohort, data.data_version('profile_scores', cohort=cohort), spec)
+
+
+def user_trace(user_scores, axes=tuple(dimensions)):
+    return go.Scatterpolar(r=user_scores, theta=list(axes), name='Your Calculation', fill='toself', line=dict(color='#fbbf24', width=4))
+
+
+def scenarios_trace(names, matrix, axes=tuple(dimensions)):
+    """All saved scenarios as one trace: closed outlines separated by gaps."""
+    n, d = matrix.shape
+    # Each outline is its d points, the first again to close it, then a gap.
+    r = np.full((n, d + 2), np.nan)
+    r[:, :d] = matrix
+    r[:, d] = matrix[:, 0]
+    theta = (list(axes) + [axes[0], axes[0]]) * n
+    text = np.repeat(names, d + 2)
+    return go.Scatterpolar(
+        r=r.ravel(), theta=theta, text=text, name=f'Saved Scenarios ({n})', mode='lines',
+        line=dict(color='#94a3b8', width=1.5), opacity=0.7, hovertemplate='%{text}<br>%{theta}: %{r}<extra></extra>',
+    )
+
+
+def radar(theme, user_scores, cohort=None, spec=index_spec.DEFAULT, scenarios=None):
+    """Cached reference radar with the user's profile (and any (names, matrix) of saved scenarios) overlaid on a copy."""
+    fig = go.Figure(radar_base(theme, cohort, spec))
+    if scenarios is not None and len(scenarios[0]):
+        fig.add_trace(scenarios_trace(*scenarios, spec.dimension_names))
+    fig.add_trace(user_trace(user_scores, spec.dimension_names))
+    return fig
+
+
+def sensitivity_heatmap(theme, matrix, step=1, axes=tuple(dimensions)):
+    """Share of the cohort reclassified when a dimension (or pair) moves by `step`."""
+    palette = THEMES[theme]
+    percent = matrix * 100
+    fig = go.Figure(go.Heatmap(
+        z=percent, x=list(axes), y=list(axes), zmin=0, zmax=100, colorscale='YlOrRd',
+        text=percent.round().astype(int), texttemplate='%{text}%',
+        hovertemplate='%{y} + %{x}: %{z:.1f}% reclassified<extra></extra>',
+        colorbar=dict(title='%'),
+    ))
+    fig.update_layout(**_layout(
+        theme,
+        title=f"Reclassified at {step:+d} per dimension",
+        plot_bgcolor=palette['secondary_bg'],
+        yaxis=dict(autorange='reversed'),
+        margin=dict(t=40, b=40)
+    ))
+    return fig
+
+
+# -----------------------------------------------------------------------------
+# AUTONOMY & CONTROL
+# -----------------------------------------------------------------------------
+def _perception_bar(name, group, color):
+    bar = go.Bar(name=name, x=group['category'].astype(str), y=group['value'], marker_color=color)
+    if 'low' in group:
+        # Bootstrap intervals from per-worker responses.
+        bar.error_y = dict(type='data', symmetric=False, array=group['high'] - group['value'], arrayminus=group['value'] - group['low'])
+        bar.customdata = group[['low', 'high', 'n']].to_numpy()
+        bar.hovertemplate = "%{x}: %{y:.2f} [%{customdata[0]:.2f}, %{customdata[1]:.2f}], n = %{customdata[2]}<extra>%{fullData.name}</extra>"
+    return bar
+
+
+@memoize("figure:autonomy_bar")
+def _autonomy_bar(theme, cohort, version, resamples, confidence):
+    palette = THEMES[theme]
+    perception = data.autonomy_perception(cohort, resamples, confidence)
+    fig_bar = go.Figure(data=[
+        _perception_bar(name, group, _color(COHORT_COLORS, name, i))
+        for i, (name, group) in enumerate(perception.groupby('cohort', observed=True, sort=False))
+    ])
+    fig_bar.update_layout(**_layout(
+        theme,
+        barmode='group',
+        plot_bgcolor=palette['secondary_bg'],
+        xaxis=dict(gridcolor=palette['chart_grid']),
+        yaxis=dict(gridcolor=palette['chart_grid'], title="Autonomy Index (0-1)")
+    ))
+    return fig_bar
+
+
+def autonomy_bar(theme, cohort=None, resamples=None, confidence=None):
+    return _autonomy_bar(theme, cohort, data.autonomy_perception_version(cohort), resamples, confidence)
+
+
+# -----------------------------------------------------------------------------
+# ECONOMIC SECURITY
+# -----------------------------------------------------------------------------
+@memoize("figure:income_lines")
+def _income_lines(theme, cohort, version):
+    palette = THEMES[theme]
+    income = data.weekly_income(cohort)
+    fig_inc = go.Figure()
+    for i, (name, group) in enumerate(income.groupby('series', observed=True, sort=False)):
+        line = INCOME_LINES.get(name, dict(color=FALLBACK_COLORS[i % len(FALLBACK_COLORS)], width=3))
+        fig_inc.add_trace(go.Scatter(x=group['week'].astype(str), y=group['earnings'], name=name, line=line))
+
+    fig_inc.update_layout(**_layout(
+        theme,
+        title="Daily/Weekly Income Variance",
+        plot_bgcolor=palette['secondary_bg'],
+        xaxis=dict(gridcolor=palette['chart_grid']),
+        yaxis=dict(gridcolor=palette['chart_grid'], title="Daily Earnings (Local Normalization)")
+    ))
+    return fig_inc
+
+
+@memoize("figure:income_daily")
+def _income_daily(theme, cohort, version, window):
+    palette = THEMES[theme]
+    daily = data.daily_income(cohort)
+    start, end = window or (None, None)
+    series = []
+    for i, (name, group) in enumerate(daily.groupby('series', observed=True, sort=False)):
+        x, y = group['date'].to_numpy(), group['earnings'].to_numpy()
+        visible = downsample.window(x, start, end)
+        x, y = x[visible], y[visible]
+        keep = downsample.downsample(x, y, PLOT_WIDTH_PX)
+        series.append((i, name, x[keep], y[keep]))
+
+    # SVG traces stall the browser beyond a few thousand points; WebGL does not.
+    trace = go.Scattergl if sum(len(x) for _, _, x, _ in series) > WEBGL_THRESHOLD else go.Scatter
+    fig_inc = go.Figure()
+    for i, name, x, y in series:
+        line = INCOME_LINES.get(name, dict(color=FALLBACK_COLORS[i % len(FALLBACK_COLORS)], width=3))
+        fig_inc.add_trace(trace(x=x, y=y, name=name, mode='lines', line=dict(line, width=min(line.get('width', 2), 2))))
+
+    fig_inc.update_layout(**_layout(
+        theme,
+        title="Daily Income Variance",
+        plot_bgcolor=palette['secondary_bg'],
+        xaxis=dict(gridcolor=palette['chart_grid']),
+        yaxis=dict(gridcolor=palette['chart_grid'], title="Daily Earnings (Local Normalization)")
+    ))
+    return fig_inc
+
+
+def income_lines(theme, cohort=None, window=None):
+    """Income chart: daily from the earnings log when there is one, else the weekly table.
+
+    Daily series are downsampled to `PLOT_WIDTH_PX` points per trace within
+    `window` (a (start, end) pair of dates), so zooming re-fetches detail while
+    the payload stays bounded however long the log is.
+    """
+    if data.earnings_log(cohort) is not None:
+        return _income_daily(theme, cohort, data.income_version(cohort), window)
+    return _income_lines(theme, cohort, data.income_version(cohort))
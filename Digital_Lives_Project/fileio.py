@@ -0,0 +1,41 @@
+"""File helpers shared by the incremental readers and the on-disk caches.
+
+    complete_lines_end   where the complete lines of a growing file end, so a
+                         reader of an export or log still being written leaves
+                         the half-written last line for the next pass
+    write_atomic         replace a cache file so that a concurrent reader sees
+                         the old content or the new, never a partial file
+"""
+import os
+import threading
+from pathlib import Path
+
+# Bytes read per step when searching backwards for the last newline.
+SCAN_BYTES = 64 * 1024
+
+
+def complete_lines_end(handle):
+    """Offset just past the last newline of the open binary `handle` (0 without one)."""
+    pos = os.fstat(handle.fileno()).st_size
+    while pos > 0:
+        step = min(SCAN_BYTES, pos)
+        handle.seek(pos - step)
+        newline = handle.read(step).rfind(b'\n')
+        if newline >= 0:
+            return pos - step + newline + 1
+        pos -= step
+    return 0
+
+
+def write_atomic(path, text):
+    """Write `text` to `path` through a temporary file and a rename; raises OSError."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Unique per process and thread: server threads may write the same cache file at once.
+    tmp = path.with_suffix(f".{os.getpid()}-{threading.get_ident()}.tmp")
+    try:
+        tmp.write_text(text)
+        os.replace(tmp, path)
+    except OSError:
+        tmp.unlink(missing_ok=True)
+        raise
@@ -0,0 +1,117 @@
+"""Gig-ness Index scoring.
+
+Shared by the dashboard's Gig-ness tab and by batch scoring of survey exports.
+Every function works on whole arrays at once, so scoring a frame of several
+hundred thousand respondents is a handful of NumPy operations.
+"""
+import numpy as np
+
+# -----------------------------------------------------------------------------
+# INDEX DEFINITION
+# -----------------------------------------------------------------------------
+dimensions = ['Income Uncertainty', 'Contractual Security', 'Income Dependency', 'Autonomy Over Time', 'Digital Mediation']
+
+MAX_DIMENSION_SCORE = 2
+MAX_SCORE = MAX_DIMENSION_SCORE * len(dimensions)
+
+# Percent thresholds, checked from the top down.
+CLASSIFICATIONS = [
+    (80, 'Extreme Precarity'),
+    (50, 'Moderate Gig-ness'),
+    (0, 'Low Precariousness'),
+]
+
+
+# -----------------------------------------------------------------------------
+# SCORING
+# -----------------------------------------------------------------------------
+def whole_scores(values):
+    """`values` (an array, or a frame of score columns) as a NumPy array of whole numbers.
+
+    Raises ValueError for non-numeric, missing (NaN / NA), infinite or fractional scores.
+    """
+    if hasattr(values, 'columns'):
+        # Nullable columns (Int8) hold pd.NA, which has no NumPy equivalent.
+        values = values.to_numpy(dtype=float, na_value=np.nan) if values.isna().to_numpy().any() else values.to_numpy()
+    values = np.asarray(values)
+    if values.dtype.kind not in 'iub':
+        try:
+            values = values.astype(float)
+        except (TypeError, ValueError):
+            raise ValueError("dimension scores must be numbers") from None
+        # Never truncate: a missing answer must not be scored as 0, nor 1.5 as 1.
+        if not np.isfinite(values).all():
+            raise ValueError("dimension scores must not be missing (NaN) or infinite")
+        if (values != np.round(values)).any():
+            raise ValueError("dimension scores must be whole numbers")
+    return values
+
+
+def _as_matrix(frame):
+    """Return the dimension columns of `frame` as an (n, 5) integer array."""
+    if hasattr(frame, 'columns'):
+        missing = [d for d in dimensions if d not in frame.columns]
+        if missing:
+            raise KeyError(f"missing Gig-ness dimensions: {missing}")
+        frame = frame[dimensions]
+    values = whole_scores(frame)
+    if values.ndim == 1:
+        values = values.reshape(1, -1)
+    if values.shape[1] != len(dimensions):
+        raise ValueError(f"expected {len(dimensions)} dimension columns, got {values.shape[1]}")
+    if values.min(initial=0) < 0 or values.max(initial=0) > MAX_DIMENSION_SCORE:
+        raise ValueError(f"dimension scores must lie in 0..{MAX_DIMENSION_SCORE}")
+    return values.astype(np.int16, copy=False)
+
+
+def classify(percent):
+    """Map percent scores (scalar or array) to classification labels."""
+    percent = np.asarray(percent)
+    conditions = [percent >= threshold for threshold, _ in CLASSIFICATIONS[:-1]]
+    labels = [label for _, label in CLASSIFICATIONS[:-1]]
+    return np.select(conditions, labels, default=CLASSIFICATIONS[-1][1])
+
+
+def nearest_profile(frame, profiles=None):
+    """Name of the closest reference profile (squared Euclidean) for each row.
+
+    `profiles` maps names to dimension vectors; by default the reference
+    profiles from the data layer.
+    """
+    if profiles is None:
+        from data import reference_profiles
+        profiles = reference_profiles()
+    values = _as_matrix(frame)
+    names = np.array(list(profiles))
+    refs = np.array([profiles[name] for name in names], dtype=np.int16)
+    # (n, 1, d) - (1, k, d) -> (n, k) distances; k is tiny so this stays cheap.
+    dist = ((values[:, None, :] - refs[None, :, :]) ** 2).sum(axis=2)
+    return names[dist.argmin(axis=1)]
+
+
+def score_batch(frame, profiles=None):
+    """Score every respondent in `frame` in one vectorized pass.
+
+    `frame` is a DataFrame with the five `dimensions` columns (or an (n, 5)
+    array). Returns a DataFrame with the same index holding `total`,
+    `percent`, `classification` and `nearest_profile`.
+    """
+    import pandas as pd
+
+    values = _as_matrix(frame)
+    total = values.sum(axis=1)
+    percent = total / MAX_SCORE * 100
+    index = frame.index if hasattr(frame, 'columns') else None
+    return pd.DataFrame({
+        'total': total,
+        'percent': percent,
+        'classification': classify(percent),
+        'nearest_profile': nearest_profile(values, profiles),
+    }, index=index)
+
+
+def score_one(user_scores):
+    """Score a single list of five dimension values, as the calculator does."""
+    total_score = int(_as_matrix(user_scores).sum())
+    percent_score = (total_score / MAX_SCORE) * 100
+    return total_score, percent_score, str(classify(percent_score))
@@ -0,0 +1,211 @@
+"""Configurable index definitions.
+
+An index spec lists the dimensions (each with a weight and a score range) and
+the percent thresholds of the classifications. The default spec is the
+Gig-ness Index of `gigness`: five equally weighted 0-2 dimensions.
+
+A spec is written as JSON, either as `index_spec.json` in a cohort's data
+directory or pasted into the Gig-ness tab:
+
+    {
+      "name": "Weighted Gig-ness",
+      "dimensions": [
+        {"name": "Income Uncertainty", "weight": 2},
+        {"name": "Platform Ratings", "weight": 1, "min": 0, "max": 4}
+      ],
+      "thresholds": [[80, "Extreme Precarity"], [50, "Moderate Gig-ness"], [0, "Low Precariousness"]]
+    }
+
+`compile_spec` turns a spec into a `CompiledIndex` - weight and range vectors
+plus the threshold table - once per spec hash; scoring a cohort is then one
+matrix-vector product and one `searchsorted` over the whole array.
+"""
+import hashlib
+import json
+import math
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+
+import gigness
+from analytics_cache import CACHE
+
+SPEC_NAME = "index_spec.json"
+# Dimension scores must lie within +/- this bound (they become slider ranges).
+SCORE_LIMIT = 100
+
+
+class IndexSpecError(ValueError):
+    """An index definition that cannot be parsed or is inconsistent."""
+
+
+@dataclass(frozen=True, slots=True)
+class Dimension:
+    name: str
+    weight: float = 1.0
+    min: int = 0
+    max: int = gigness.MAX_DIMENSION_SCORE
+
+
+@dataclass(frozen=True, slots=True)
+class IndexSpec:
+    dimensions: tuple
+    thresholds: tuple
+    name: str = "Gig-ness Index"
+
+    @property
+    def dimension_names(self):
+        return tuple(d.name for d in self.dimensions)
+
+    def to_dict(self):
+        return {
+            'name': self.name,
+            'dimensions': [{'name': d.name, 'weight': d.weight, 'min': d.min, 'max': d.max} for d in self.dimensions],
+            'thresholds': [list(t) for t in self.thresholds],
+        }
+
+    @property
+    def digest(self):
+        """SHA-256 of the canonical JSON form: the cache key of the compiled index."""
+        canonical = json.dumps(self.to_dict(), sort_keys=True, separators=(',', ':'))
+        return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+DEFAULT = IndexSpec(
+    dimensions=tuple(Dimension(name) for name in gigness.dimensions),
+    thresholds=tuple(gigness.CLASSIFICATIONS),
+)
+
+
+# -----------------------------------------------------------------------------
+# PARSING
+# -----------------------------------------------------------------------------
+def parse(source):
+    """An IndexSpec from a dict or a JSON string."""
+    if isinstance(source, str):
+        try:
+            source = json.loads(source)
+        except ValueError as exc:
+            raise IndexSpecError(f"index spec is not valid JSON: {exc}") from None
+    if not isinstance(source, dict):
+        raise IndexSpecError("index spec must be a JSON object")
+
+    raw_dimensions = source.get('dimensions')
+    if not isinstance(raw_dimensions, list) or not raw_dimensions:
+        raise IndexSpecError("'dimensions' must be a non-empty list")
+    dimensions = []
+    for raw in raw_dimensions:
+        raw = {'name': raw} if isinstance(raw, str) else raw
+        if not isinstance(raw, dict) or not isinstance(raw.get('name'), str) or not raw['name']:
+            raise IndexSpecError(f"dimension {raw!r} needs a name")
+        unknown = set(raw) - {'name', 'weight', 'min', 'max'}
+        if unknown:
+            raise IndexSpecError(f"dimension {raw['name']!r}: unknown fields {sorted(unknown)}")
+        try:
+            weight = float(raw.get('weight', 1.0))
+            low, high = (float(raw.get(k, default)) for k, default in (('min', 0), ('max', gigness.MAX_DIMENSION_SCORE)))
+        except (TypeError, ValueError):
+            raise IndexSpecError(f"dimension {raw['name']!r}: weight, min and max must be numbers") from None
+        if not math.isfinite(weight) or weight < 0:
+            raise IndexSpecError(f"dimension {raw['name']!r}: weight must be a finite number >= 0")
+        if not all(math.isfinite(v) and v == int(v) and abs(v) <= SCORE_LIMIT for v in (low, high)):
+            raise IndexSpecError(f"dimension {raw['name']!r}: min and max must be whole numbers within ±{SCORE_LIMIT}")
+        if high <= low:
+            raise IndexSpecError(f"dimension {raw['name']!r}: needs max > min")
+        dimension = Dimension(raw['name'], weight, int(low), int(high))
+        dimensions.append(dimension)
+    names = [d.name for d in dimensions]
+    if len(set(names)) != len(names):
+        raise IndexSpecError("dimension names must be unique")
+    if not any(d.weight for d in dimensions):
+        raise IndexSpecError("at least one dimension needs a non-zero weight")
+
+    raw_thresholds = source.get('thresholds', gigness.CLASSIFICATIONS)
+    try:
+        thresholds = tuple(sorted(((float(t), str(label)) for t, label in raw_thresholds), reverse=True))
+    except (TypeError, ValueError):
+        raise IndexSpecError("'thresholds' must be a list of [percent, label] pairs") from None
+    if not all(0 <= t <= 100 for t, _ in thresholds):
+        raise IndexSpecError("threshold percents must lie between 0 and 100")
+    if not thresholds or thresholds[-1][0] > 0:
+        raise IndexSpecError("thresholds must include a lowest class starting at 0")
+    return IndexSpec(tuple(dimensions), thresholds, str(source.get('name', DEFAULT.name)))
+
+
+def load(path):
+    """The spec in a JSON file."""
+    return parse(Path(path).read_text(encoding='utf-8'))
+
+
+def for_cohort(cohort=None):
+    """The cohort's `index_spec.json` if it has one, else the default Gig-ness Index."""
+    import data
+
+    path = data.cohort_dir(cohort) / SPEC_NAME
+    if not path.is_file():
+        return DEFAULT
+    stat = path.stat()
+    return CACHE.get_or_compute(('index_spec_file', str(path), stat.st_mtime_ns, stat.st_size), lambda: load(path))
+
+
+# -----------------------------------------------------------------------------
+# COMPILED EVALUATOR
+# -----------------------------------------------------------------------------
+class CompiledIndex:
+    """Vectorized scorer for one spec. Build through `compile_spec`."""
+
+    def __init__(self, spec):
+        self.spec = spec
+        self.names = spec.dimension_names
+        self.weights = np.array([d.weight for d in spec.dimensions])
+        self.mins = np.array([d.min for d in spec.dimensions])
+        self.maxs = np.array([d.max for d in spec.dimensions])
+        self.min_total = float(self.weights @ self.mins)
+        self.max_total = float(self.weights @ self.maxs)
+        # Ascending thresholds for searchsorted; labels in the same order.
+        self._thresholds = np.array([t for t, _ in reversed(spec.thresholds[:-1])])
+        self.labels = np.array([label for _, label in reversed(spec.thresholds)])
+
+    def matrix(self, values):
+        """`values` (an (n, d) array, or a frame with the spec's columns) as a checked float array."""
+        if hasattr(values, 'columns'):
+            missing = [d for d in self.names if d not in values.columns]
+            if missing:
+                raise KeyError(f"missing index dimensions: {missing}")
+            values = values[list(self.names)]
+        # Every dimension has a whole-number range: NaN and fractions are rejected, never scored.
+        values = gigness.whole_scores(values).astype(float)
+        if values.ndim == 1:
+            values = values.reshape(1, -1)
+        if values.shape[1] != len(self.names):
+            raise ValueError(f"expected {len(self.names)} dimension columns, got {values.shape[1]}")
+        if (values < self.mins).any() or (values > self.maxs).any():
+            raise ValueError("dimension scores outside the spec's ranges")
+        return values
+
+    def totals(self, values):
+        return self.matrix(values) @ self.weights
+
+    def percent(self, totals):
+        return (np.asarray(totals) - self.min_total) / (self.max_total - self.min_total) * 100
+
+    def class_index(self, percent):
+        """Class positions, 0 = lowest, for an array of percents."""
+        return np.searchsorted(self._thresholds, percent, side='right')
+
+    def evaluate(self, values):
+        """(totals, percents, labels) for every row in one pass."""
+        totals = self.totals(values)
+        percent = self.percent(totals)
+        return totals, percent, self.labels[self.class_index(percent)]
+
+    def score_one(self, scores):
+        """(total, percent, label) for one list of dimension scores, as the calculator shows."""
+        totals, percent, labels = self.evaluate(scores)
+        return float(totals[0]), float(percent[0]), str(labels[0])
+
+
+def compile_spec(spec=DEFAULT):
+    """The compiled evaluator for `spec`, built once per spec hash and shared process-wide."""
+    return CACHE.get_or_compute(('index_spec', spec.digest), lambda: CompiledIndex(spec))
@@ -0,0 +1,241 @@
+"""Streaming ingestion of earnings logs into incremental aggregates.
+
+An earnings log is a CSV of mobile-money / WhatsApp-derived earnings records,
+one row per worker per earning day:
+
+    worker_id,profile,date,amount
+
+The log is read in fixed-size chunks and folded into running aggregates, so
+memory is bounded by the number of workers and weeks, never by the log length.
+Means and variances are merged per chunk with Chan et al.'s parallel update.
+When the log file grows, only the appended bytes are read.
+"""
+import io
+import os
+import threading
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from fileio import complete_lines_end
+
+LOG_COLUMNS = ['worker_id', 'profile', 'date', 'amount']
+LOG_DTYPES = {'worker_id': 'string', 'profile': 'string', 'amount': 'float64'}
+CHUNK_ROWS = 250_000
+
+# Coefficient-of-variation cut points for the Income Uncertainty dimension:
+# below the first is stable (0), below the second moderately volatile (1).
+VOLATILITY_CV_THRESHOLDS = (0.15, 0.40)
+
+
+# -----------------------------------------------------------------------------
+# READING
+# -----------------------------------------------------------------------------
+class _BoundedReader(io.RawIOBase):
+    """Expose at most `limit` bytes of a binary file object."""
+
+    def __init__(self, raw, limit):
+        self._raw = raw
+        self._left = limit
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        if self._left <= 0:
+            return 0
+        view = memoryview(buffer)[:self._left]
+        n = self._raw.readinto(view)
+        self._left -= n
+        return n
+
+
+def iter_chunks(path, start=0, end=None, chunk_rows=CHUNK_ROWS, coerce=False):
+    """Yield typed DataFrame chunks of the log between byte offsets `start` and `end`.
+
+    `start` is either 0 (the header is read) or an offset past the header. An
+    unparseable date becomes NaT and a row with too many fields is skipped; an
+    unparseable amount raises ValueError, or becomes NaN with `coerce`.
+    """
+    with open(path, 'rb') as handle:
+        end = os.fstat(handle.fileno()).st_size if end is None else end
+        if end <= start:
+            return
+        if not start and not handle.readline(end).endswith(b'\n'):
+            # No complete header yet: an empty or partly written log.
+            return
+        handle.seek(start)
+        reader = io.BufferedReader(_BoundedReader(handle, end - start))
+        dtypes = {**LOG_DTYPES, 'amount': 'string'} if coerce else LOG_DTYPES
+        options = dict(usecols=LOG_COLUMNS, dtype=dtypes, parse_dates=['date'], chunksize=chunk_rows, on_bad_lines='skip')
+        if start:
+            options.update(header=None, names=LOG_COLUMNS)
+        with pd.read_csv(reader, **options) as chunks:
+            for chunk in chunks:
+                if chunk.empty:
+                    continue
+                if not pd.api.types.is_datetime64_dtype(chunk['date']):
+                    chunk['date'] = pd.to_datetime(chunk['date'], errors='coerce')
+                if coerce:
+                    chunk['amount'] = pd.to_numeric(chunk['amount'], errors='coerce').astype('float64')
+                yield chunk
+
+
+# -----------------------------------------------------------------------------
+# AGGREGATES
+# -----------------------------------------------------------------------------
+def _merge_moments(left, right):
+    """Combine two frames of (n, mean, m2) moments that share an index."""
+    if left.empty:
+        return right
+    left, right = left.align(right, fill_value=0)
+    n = left['n'] + right['n']
+    delta = right['mean'] - left['mean']
+    safe_n = n.where(n > 0, 1)
+    mean = left['mean'] + delta * right['n'] / safe_n
+    m2 = left['m2'] + right['m2'] + delta ** 2 * left['n'] * right['n'] / safe_n
+    return pd.DataFrame({'n': n, 'mean': mean, 'm2': m2})
+
+
+def _chunk_moments(chunk, keys):
+    grouped = chunk.groupby(keys, observed=True, sort=False)['amount']
+    moments = grouped.agg(n='count', mean='mean', var='var').astype('float64')
+    moments['m2'] = moments.pop('var').fillna(0) * (moments['n'] - 1)
+    return moments
+
+
+def _with_dispersion(moments):
+    frame = moments.copy()
+    frame['variance'] = frame['m2'] / (frame['n'] - 1).where(frame['n'] > 1)
+    frame['cv'] = np.sqrt(frame['variance']) / frame['mean'].where(frame['mean'] != 0)
+    return frame.drop(columns='m2').astype({'n': 'int64'})
+
+
+def volatility_score(cv):
+    """Map coefficients of variation to the 0-2 Income Uncertainty scale."""
+    cv = np.asarray(cv, dtype=float)
+    score = np.searchsorted(VOLATILITY_CV_THRESHOLDS, np.nan_to_num(cv), side='right')
+    return np.where(np.isnan(cv), np.nan, score)
+
+
+class IncomeAggregates:
+    """Running per-worker, per-profile and daily aggregates of an earnings log."""
+
+    def __init__(self):
+        empty = pd.DataFrame({'n': [], 'mean': [], 'm2': []})
+        self.workers = empty
+        self.profiles = empty
+        self.daily = pd.DataFrame({'n': [], 'total': []})
+        self.offset = 0
+        self.rows = 0
+        # Rows dropped for a missing or malformed date or amount.
+        self.skipped = 0
+
+    def update(self, chunk):
+        """Fold one chunk of log rows into the aggregates, dropping rows without a date or amount."""
+        valid = chunk.dropna(subset=['date', 'amount'])
+        self.skipped += len(chunk) - len(valid)
+        chunk = valid
+        if chunk.empty:
+            return
+        self.workers = _merge_moments(self.workers, _chunk_moments(chunk, ['worker_id', 'profile']))
+        self.profiles = _merge_moments(self.profiles, _chunk_moments(chunk, 'profile'))
+        day = chunk['date'].dt.normalize()
+        buckets = chunk.groupby(['profile', day], observed=True, sort=False)['amount'].agg(n='count', total='sum')
+        self.daily = buckets if self.daily.empty else self.daily.add(buckets, fill_value=0)
+        self.rows += len(chunk)
+
+    def merge(self, other):
+        """Fold the aggregates of another part of the log into these."""
+        self.workers = _merge_moments(self.workers, other.workers)
+        self.profiles = _merge_moments(self.profiles, other.profiles)
+        if not other.daily.empty:
+            self.daily = other.daily if self.daily.empty else self.daily.add(other.daily, fill_value=0)
+        self.rows += other.rows
+        self.skipped += other.skipped
+
+    def ingest(self, path, chunk_rows=CHUNK_ROWS):
+        """Read whatever has been appended to `path` since the last call.
+
+        The new rows are aggregated apart and merged only once all of them are
+        read, so a read that fails part-way leaves the aggregates and `offset`
+        as they were.
+        """
+        with open(path, 'rb') as handle:
+            end = complete_lines_end(handle)
+        if end <= self.offset:
+            # Nothing but a half-written line (or an incomplete header) since the last call.
+            return self
+        try:
+            appended = self._read(path, end, chunk_rows)
+        except ValueError:
+            # A malformed amount; read the same rows again, dropping it.
+            appended = self._read(path, end, chunk_rows, coerce=True)
+        self.merge(appended)
+        self.offset = end
+        return self
+
+    def _read(self, path, end, chunk_rows, coerce=False):
+        appended = IncomeAggregates()
+        for chunk in iter_chunks(path, self.offset, end, chunk_rows, coerce):
+            appended.update(chunk)
+        return appended
+
+    def per_worker(self):
+        """n, mean, variance and cv per (worker_id, profile)."""
+        return _with_dispersion(self.workers)
+
+    def per_profile(self):
+        """n, mean, variance, cv and the Income Uncertainty score per profile."""
+        frame = _with_dispersion(self.profiles)
+        frame['volatility_score'] = volatility_score(frame['cv'])
+        return frame
+
+    def daily_earnings(self):
+        """Mean earnings per profile and day: series, date, earnings, sorted by date."""
+        frame = _mean_earnings(self.daily, 'date')
+        return frame.sort_values('date', kind='stable', ignore_index=True)
+
+    def weekly_earnings(self):
+        """Mean daily earnings per profile and week, in the `income_weekly` layout."""
+        daily = self.daily
+        if not daily.empty:
+            week = daily.index.get_level_values(1).to_period('W').start_time
+            daily = daily.groupby([daily.index.get_level_values(0), week]).sum()
+        frame = _mean_earnings(daily.sort_index(), 'week')
+        frame['week'] = frame['week'].dt.strftime('%Y-%m-%d')
+        return frame.astype({'week': 'category'})
+
+
+def _mean_earnings(buckets, period):
+    """(profile, period) -> (n, total) buckets as a series/period/earnings frame."""
+    if buckets.empty:
+        return pd.DataFrame({'series': pd.Categorical([]), period: pd.to_datetime([]), 'earnings': []})
+    frame = (buckets['total'] / buckets['n']).rename('earnings').reset_index()
+    frame.columns = ['series', period, 'earnings']
+    return frame.astype({'series': 'category'})
+
+
+# -----------------------------------------------------------------------------
+# PROCESS-WIDE REGISTRY
+# -----------------------------------------------------------------------------
+_registry = {}
+_registry_lock = threading.Lock()
+
+
+def aggregates_for(path):
+    """Up-to-date aggregates for the log at `path`, shared across sessions.
+
+    Appended data is ingested incrementally; a truncated or replaced log
+    (smaller than what was already read) is re-read from the start.
+    """
+    path = str(Path(path).resolve())
+    with _registry_lock:
+        entry = _registry.get(path)
+        size = os.stat(path).st_size
+        if entry is None or size < entry.offset:
+            entry = _registry[path] = IncomeAggregates()
+        if size > entry.offset:
+            entry.ingest(path)
+        return entry
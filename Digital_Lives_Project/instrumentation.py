@@ -0,0 +1,223 @@
+"""Opt-in rerun instrumentation.
+
+With `GIG_INSTRUMENT=1` the app times its sections (CSS injection, sidebar,
+each tab body) and every chart and table it renders, per session and across
+the process, along with the element payload sizes. Opening the app with
+`?admin=1` shows the timings in a sidebar panel with JSON and Prometheus
+text exports.
+
+When disabled, `section` returns a shared no-op context manager and the
+element wrappers call straight through to Streamlit, so the cost is one
+attribute check per call.
+"""
+import contextlib
+import json
+import os
+import threading
+import time
+
+import streamlit as st
+
+ENABLED = os.environ.get("GIG_INSTRUMENT", "") not in ("", "0")
+METRIC_PREFIX = "gig_dashboard"
+
+_NULL = contextlib.nullcontext()
+_SESSION_KEY = "_instrumentation"
+
+
+class Stats:
+    """Running timing and payload statistics of one section."""
+
+    __slots__ = ('count', 'total', 'max', 'last', 'payload')
+
+    def __init__(self):
+        self.count = 0
+        self.total = self.max = self.last = 0.0
+        self.payload = None
+
+    def add(self, seconds, payload=None):
+        self.count += 1
+        self.total += seconds
+        self.last = seconds
+        self.max = max(self.max, seconds)
+        if payload is not None:
+            self.payload = payload
+
+    def as_dict(self):
+        return {
+            'count': self.count,
+            'mean_ms': round(self.total / self.count * 1000, 3) if self.count else 0.0,
+            'last_ms': round(self.last * 1000, 3),
+            'max_ms': round(self.max * 1000, 3),
+            'total_ms': round(self.total * 1000, 3),
+            'payload_bytes': self.payload,
+        }
+
+
+_aggregate = {}
+_aggregate_lock = threading.Lock()
+
+
+def _session_stats():
+    return st.session_state.setdefault(_SESSION_KEY, {})
+
+
+def record(name, seconds, payload=None):
+    """Add one timing (and optionally a payload size) to the session and process stats."""
+    session = _session_stats()
+    session.setdefault(name, Stats()).add(seconds, payload)
+    with _aggregate_lock:
+        _aggregate.setdefault(name, Stats()).add(seconds, payload)
+
+
+# -----------------------------------------------------------------------------
+# TIMERS
+# -----------------------------------------------------------------------------
+class _Section:
+    __slots__ = ('name', 'start', 'payload')
+
+    def __init__(self, name):
+        self.name = name
+        self.payload = None
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        # Also recorded when a rerun or st.stop() unwinds through the block.
+        record(self.name, time.perf_counter() - self.start, self.payload)
+        return False
+
+
+def section(name):
+    """Time the enclosed block as `name`; a shared no-op when disabled."""
+    return _Section(name) if ENABLED else _NULL
+
+
+def _figure_bytes(fig):
+    return len(fig.to_json())
+
+
+def _table_bytes(data):
+    from streamlit import dataframe_util
+
+    try:
+        return len(dataframe_util.convert_anything_to_arrow_bytes(data))
+    except Exception:  # sizing is best-effort; never fail the render
+        return None
+
+
+def plotly_chart(name, fig, **kwargs):
+    """`st.plotly_chart`, timed as `chart:<name>`."""
+    if not ENABLED:
+        return st.plotly_chart(fig, **kwargs)
+    # Sized outside the timed block, so the timing is the render alone.
+    payload = _figure_bytes(fig)
+    with section(f"chart:{name}") as timer:
+        timer.payload = payload
+        result = st.plotly_chart(fig, **kwargs)
+    return result
+
+
+def table(name, data, **kwargs):
+    """`st.table`, timed as `table:<name>`."""
+    if not ENABLED:
+        return st.table(data, **kwargs)
+    # Sized outside the timed block, so the timing is the render alone.
+    payload = _table_bytes(data)
+    with section(f"table:{name}") as timer:
+        timer.payload = payload
+        result = st.table(data, **kwargs)
+    return result
+
+
+def dataframe(name, data, **kwargs):
+    """`st.dataframe`, timed as `table:<name>`."""
+    if not ENABLED:
+        return st.dataframe(data, **kwargs)
+    # Sized outside the timed block, so the timing is the render alone.
+    payload = _table_bytes(data)
+    with section(f"table:{name}") as timer:
+        timer.payload = payload
+        result = st.dataframe(data, **kwargs)
+    return result
+
+
+# -----------------------------------------------------------------------------
+# EXPORT
+# -----------------------------------------------------------------------------
+def snapshot():
+    """Session and process-wide statistics, and the analytics cache counters, as plain dicts."""
+    from analytics_cache import CACHE
+
+    with _aggregate_lock:
+        aggregate = {name: stats.as_dict() for name, stats in _aggregate.items()}
+    session = {name: stats.as_dict() for name, stats in _session_stats().items()}
+    return {'session': session, 'process': aggregate, 'cache': CACHE.stats()}
+
+
+def to_json():
+    return json.dumps(snapshot(), indent=2)
+
+
+def _label(value):
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def to_prometheus():
+    """Process-wide statistics in the Prometheus text exposition format."""
+    with _aggregate_lock:
+        items = sorted((name, stats.as_dict()) for name, stats in _aggregate.items())
+    name = f"{METRIC_PREFIX}_section_seconds"
+    lines = [
+        f"# HELP {name} Time spent rendering dashboard sections.",
+        f"# TYPE {name} summary",
+    ]
+    for section_name, stats in items:
+        label = f'{{section="{_label(section_name)}"}}'
+        lines.append(f"{name}_count{label} {stats['count']}")
+        lines.append(f"{name}_sum{label} {stats['total_ms'] / 1000:.6f}")
+    payload = f"{METRIC_PREFIX}_payload_bytes"
+    lines += [
+        f"# HELP {payload} Serialized size of the last element rendered by a section.",
+        f"# TYPE {payload} gauge",
+    ]
+    for section_name, stats in items:
+        if stats['payload_bytes'] is not None:
+            lines.append(f'{payload}{{section="{_label(section_name)}"}} {stats["payload_bytes"]}')
+    return "\n".join(lines + _cache_metrics()) + "\n"
+
+
+def _cache_metrics():
+    from analytics_cache import CACHE
+
+    stats = CACHE.stats()
+    lines = []
+    for event in ('hits', 'misses', 'evictions', 'expirations'):
+        name = f"{METRIC_PREFIX}_cache_{event}_total"
+        lines += [f"# HELP {name} Analytics cache {event}.", f"# TYPE {name} counter"]
+        lines += [f'{name}{{namespace="{_label(ns)}"}} {c[event]}' for ns, c in sorted(stats['namespaces'].items())]
+    for field in ('bytes', 'max_bytes', 'entries'):
+        name = f"{METRIC_PREFIX}_cache_{field}"
+        lines += [f"# HELP {name} Analytics cache {field.replace('_', ' ')}.", f"# TYPE {name} gauge", f"{name} {stats[field]}"]
+    return lines
+
+
+# -----------------------------------------------------------------------------
+# ADMIN PANEL
+# -----------------------------------------------------------------------------
+def admin_panel():
+    """Sidebar timings and exports, shown only when enabled and the URL has ?admin=1."""
+    if not ENABLED or st.query_params.get("admin") != "1":
+        return
+    data = snapshot()
+    with st.sidebar.expander("🛠 Instrumentation"):
+        scope = st.radio("Scope", ["session", "process"], horizontal=True, key="_instrumentation_scope")
+        rows = [{'section': name, **stats} for name, stats in sorted(data[scope].items())]
+        st.dataframe(rows, hide_index=True, use_container_width=True)
+        cache = data['cache']
+        st.caption(f"Analytics cache: {cache['entries']} entries, {cache['bytes'] / 2**20:.1f} of {cache['max_bytes'] / 2**20:.0f} MB, hit ratio {cache['hit_ratio']}")
+        st.dataframe([{'namespace': ns, **c} for ns, c in sorted(cache['namespaces'].items())], hide_index=True, use_container_width=True)
+        st.download_button("Export JSON", to_json(), "instrumentation.json", "application/json")
+        st.download_button("Export Prometheus", to_prometheus(), "instrumentation.prom", "text/plain")
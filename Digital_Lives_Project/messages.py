@@ -0,0 +1,285 @@
+"""Work-coordination share of exported WhatsApp chats and mobile-money SMS logs.
+
+A cohort may hold a `messages/` directory of exports:
+
+    *.txt   WhatsApp "Export chat" files, one message per header line
+            ("12/03/2024, 14:05 - Name: text" or "[12/03/2024, 14:05:33] Name: text"),
+            with continuation lines for multi-line messages
+    *.csv   SMS logs with a `body` (or `message` / `text`) column
+
+Every message is tagged with the work categories of the Interactive Explorer
+cards - order management, schedule negotiation, payment - by one compiled
+alternation of keyword patterns (English and Swahili), one named group per
+category. The Digital Mediation tab reports the share of messages that carry
+any tag.
+
+Files are read line by line, so memory does not grow with the archive. The
+counts of each file are cached under `CACHE_DIR` with the byte offset read so
+far; when an export grows (a new export of the same chat, or an appended SMS
+log) only the new bytes are classified. Stale files are processed on a process
+pool:
+
+    python messages.py           # e.g. as a deployment step
+"""
+import csv
+import hashlib
+import json
+import logging
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import data
+from analytics_cache import memoize
+from fileio import complete_lines_end, write_atomic
+
+log = logging.getLogger(__name__)
+
+CACHE_DIR = Path(os.environ.get("GIG_MESSAGES_CACHE_DIR", data.DATA_DIR / ".cache" / "messages"))
+MAX_WORKERS = int(os.environ.get("GIG_MESSAGE_WORKERS", os.cpu_count() or 1))
+
+# Digital tool share reported by the study; shown while a cohort has no exports.
+STUDY_TOOL_SHARE = 0.35
+
+# -----------------------------------------------------------------------------
+# PATTERNS
+# -----------------------------------------------------------------------------
+_AMOUNT = r"\d[\d,.]*\s?(?:/=|tsh|tzs|shillings?)"
+CATEGORIES = {
+    'order': ("Order management", [
+        r"orders?", r"ordered", r"oda", r"agiz[ao]", r"deliver(?:y|ed|ies)?", r"pick\s?up", r"drop\s?off",
+        r"parcels?", r"packages?", r"mzigo", r"bidhaa", r"stock", r"bookings?", r"booked", r"reserv(?:e|ed|ation)",
+    ]),
+    'schedule': ("Schedule negotiation", [
+        r"schedule[ds]?", r"reschedul\w*", r"postpone[ds]?", r"tomorrow", r"tonight", r"kesho", r"leo saa",
+        r"saa\s\d{1,2}", r"\d{1,2}(?::\d{2})?\s?[ap]\.?m\.?", r"o'?clock", r"what time", r"shifts?", r"zamu",
+        r"subiri", r"available", r"come at", r"ready by", r"opening hours",
+    ]),
+    'payment': ("Payment", [
+        r"m-?pesa", r"tigo\s?pesa", r"halo\s?pesa", r"airtel money", r"ezy\s?pesa", r"(?:tsh|tzs)\s?\d[\d,.]*", _AMOUNT,
+        r"pay(?:s|ment|ing)?", r"paid", r"lipa", r"malipo", r"pesa", r"cash", r"deposit(?:ed)?", r"transfer(?:red)?",
+        r"umepokea", r"received", r"salio", r"balance", r"invoice", r"price", r"bei", r"fare", r"nauli",
+    ]),
+}
+LABELS = {key: label for key, (label, _) in CATEGORIES.items()}
+
+# One pass over a message finds every category: the match's group names the category.
+# The word boundaries sit outside the alternation, so most positions fail on the
+# first check; text is lowercased once instead of matching with IGNORECASE.
+PATTERN = re.compile(
+    r"\b(?:" + "|".join(rf"(?P<{key}>{'|'.join(words)})" for key, (_, words) in CATEGORIES.items()) + r")\b"
+)
+
+# A WhatsApp message header (Android or iOS export); system lines have no sender.
+CHAT_HEADER = re.compile(
+    r"^\u200e?\[?\d{1,4}[./-]\d{1,2}[./-]\d{1,4},?\s+\d{1,2}:\d{2}(?::\d{2})?(?:\s?[APap]\.?[Mm]\.?)?\]?\s*(?:-\s*)?"
+    r"(?:(?P<sender>[^:]{1,80}):\s)?(?P<text>.*)$"
+)
+SMS_BODY_COLUMNS = ('body', 'message', 'text')
+# Leading bytes compared to tell a grown export from a different file.
+HEAD_BYTES = 4096
+
+# Bump when the patterns or the cache layout change; cached counts are then discarded.
+CLASSIFIER_FORMAT = 1
+_FINGERPRINT = hashlib.sha256(f"messages-v{CLASSIFIER_FORMAT}:{PATTERN.pattern}".encode()).hexdigest()[:16]
+
+
+def tags(text):
+    """The category keys mentioned in `text`."""
+    found = set()
+    for match in PATTERN.finditer(text.lower()):
+        found.add(match.lastgroup)
+        if len(found) == len(CATEGORIES):
+            break
+    return found
+
+
+# -----------------------------------------------------------------------------
+# FILE STATE
+# -----------------------------------------------------------------------------
+def _empty_state(path):
+    return {
+        'format': _FINGERPRINT,
+        'path': str(path),
+        'offset': 0,
+        'messages': 0,
+        'tagged': 0,
+        'counts': dict.fromkeys(CATEGORIES, 0),
+        # A chat's last message may continue in the next export, so it is
+        # re-read from `open_offset` with its tags taken back out.
+        'open_offset': None,
+        'open_tags': [],
+        'body_column': None,
+        'head': None,
+        'head_size': 0,
+    }
+
+
+def _head(handle, size):
+    """Digest of the first `size` bytes, to tell an appended file from a replaced one."""
+    handle.seek(0)
+    return hashlib.sha256(handle.read(size)).hexdigest()
+
+
+def _count(state, found, sign=1):
+    state['messages'] += sign
+    if found:
+        state['tagged'] += sign
+    for key in found:
+        state['counts'][key] += sign
+
+
+def _scan_chat(handle, state, end):
+    """Classify WhatsApp messages from the handle's position up to `end`."""
+    if state['open_offset'] is not None:
+        _count(state, state['open_tags'], -1)
+        handle.seek(state['open_offset'])
+    position = handle.tell()
+    current, start = None, None
+    while position < end:
+        line = handle.readline()
+        line_start, position = position, position + len(line)
+        text = line.decode('utf-8', 'replace').rstrip('\r\n')
+        header = CHAT_HEADER.match(text)
+        if header is not None:
+            if current is not None:
+                _count(state, current)
+            # System lines ("Messages are end-to-end encrypted") end a message but are not one.
+            current = tags(header['text']) if header['sender'] else None
+            start = line_start
+        elif current is not None:
+            current |= tags(text)
+    if current is not None:
+        _count(state, current)
+        state['open_offset'], state['open_tags'] = start, sorted(current)
+    elif start is not None:
+        state['open_offset'], state['open_tags'] = None, []
+
+
+def _lines(handle, end):
+    while handle.tell() < end:
+        yield handle.readline().decode('utf-8', 'replace')
+
+
+def _scan_sms(handle, state, end):
+    """Classify SMS rows from the handle's position up to `end`."""
+    rows = csv.reader(_lines(handle, end))
+    if state['body_column'] is None:
+        header = [name.strip().lower() for name in next(rows, [])]
+        column = next((header.index(name) for name in SMS_BODY_COLUMNS if name in header), None)
+        if column is None:
+            log.warning("%s: no %s column; skipped", state['path'], '/'.join(SMS_BODY_COLUMNS))
+            column = -1
+        state['body_column'] = column
+    column = state['body_column']
+    if column < 0:
+        return
+    for row in rows:
+        if len(row) > column:
+            _count(state, tags(row[column]))
+
+
+def update_file(path, state=None):
+    """The file's counts, classifying only what was added since `state`; runs in a pool worker."""
+    path = Path(path)
+    if state is None or state.get('format') != _FINGERPRINT:
+        state = _empty_state(path)
+    with open(path, 'rb') as handle:
+        end = complete_lines_end(handle)
+        if end < state['offset'] or (state['head'] is not None and _head(handle, state['head_size']) != state['head']):
+            # Truncated or replaced: start over.
+            state = _empty_state(path)
+        head_size = min(end, HEAD_BYTES)
+        head = _head(handle, head_size)
+        handle.seek(state['offset'])
+        if path.suffix == '.csv':
+            _scan_sms(handle, state, end)
+        else:
+            _scan_chat(handle, state, end)
+    stat = os.stat(path)
+    state.update(offset=end, head=head, head_size=head_size, size=stat.st_size, mtime_ns=stat.st_mtime_ns)
+    return state
+
+
+# -----------------------------------------------------------------------------
+# CACHE
+# -----------------------------------------------------------------------------
+def cache_path(path):
+    return CACHE_DIR / f"{hashlib.sha1(str(Path(path).resolve()).encode()).hexdigest()[:16]}.json"
+
+
+def _read_state(path):
+    try:
+        return json.loads(cache_path(path).read_text())
+    except (OSError, ValueError):
+        return None
+
+
+def _store_state(path, state):
+    try:
+        write_atomic(cache_path(path), json.dumps(state))
+    except OSError as exc:
+        log.warning("cannot cache message counts for %s: %s", path, exc)
+
+
+def _is_current(state, path):
+    if state is None or state.get('format') != _FINGERPRINT:
+        return False
+    stat = path.stat()
+    return state.get('size') == stat.st_size and state.get('mtime_ns') == stat.st_mtime_ns
+
+
+# -----------------------------------------------------------------------------
+# ACCESS
+# -----------------------------------------------------------------------------
+def export_files(cohort=None):
+    """The cohort's chat and SMS exports, sorted."""
+    base = data.cohort_dir(cohort) / data.MESSAGES_DIR_NAME
+    if not base.is_dir():
+        return []
+    return sorted(p for p in base.rglob('*') if p.suffix in ('.txt', '.csv') and p.is_file())
+
+
+def refresh(files, max_workers=MAX_WORKERS):
+    """Bring every file's cached counts up to date; returns the states in file order."""
+    states = {path: _read_state(path) for path in files}
+    stale = [path for path, state in states.items() if not _is_current(state, path)]
+    if len(stale) > 1 and max_workers > 1:
+        with ProcessPoolExecutor(max_workers=min(max_workers, len(stale))) as pool:
+            updated = list(pool.map(update_file, stale, [states[p] for p in stale]))
+    else:
+        updated = [update_file(path, states[path]) for path in stale]
+    for path, state in zip(stale, updated):
+        _store_state(path, state)
+        states[path] = state
+    return [states[path] for path in files]
+
+
+@memoize("messages")
+def _mediation(cohort, versions):
+    states = refresh([Path(path) for path, _, _ in versions])
+    counts = {key: sum(s['counts'][key] for s in states) for key in CATEGORIES}
+    return {
+        'files': len(states),
+        'messages': sum(s['messages'] for s in states),
+        'tagged': sum(s['tagged'] for s in states),
+        'categories': {LABELS[key]: count for key, count in counts.items()},
+    }
+
+
+def mediation(cohort=None):
+    """Message, work-tagged and per-category counts over the cohort's exports, or None without any."""
+    files = export_files(cohort)
+    if not files:
+        return None
+    versions = tuple((str(p), p.stat().st_mtime_ns, p.stat().st_size) for p in files)
+    return _mediation(cohort, versions)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    for cohort in data.cohorts():
+        result = mediation(cohort)
+        if result is not None:
+            print(f"{cohort or 'study sample'}: {result['tagged']} of {result['messages']} messages in {result['files']} files coordinate work")
@@ -0,0 +1,175 @@
+"""Typed, shared worker-profile model.
+
+A `Roster` is built once per cohort and data version and shared read-only by
+every session. Profiles are slotted frozen dataclasses, and each card's HTML is
+rendered on first use and then reused; the card markup carries no theme values
+(theming is done by CSS variables), so one rendering serves both themes.
+`RosterIndex` holds the roster's precomputed sort order and facet codes, so
+filtering and paging never touch the profiles themselves.
+"""
+import html
+import re
+from dataclasses import dataclass
+
+import numpy as np
+
+import data
+from analytics_cache import memoize
+from gigness import classify
+
+# Profile keys with a dedicated card style in the stylesheet.
+CARD_STYLES = frozenset({'zanzibar', 'supplemental', 'dependent'})
+
+# Filterable facets: label -> WorkerProfile attribute.
+FACETS = {
+    'Gig Score band': 'band',
+    'Structure': 'structure',
+    'Schedule': 'schedule',
+}
+
+_PERCENT = re.compile(r'\((\d+(?:\.\d+)?)%\)')
+_FRACTION = re.compile(r'(\d+(?:\.\d+)?)\s*/\s*(\d+(?:\.\d+)?)')
+
+# Display label -> attribute, in card order (after the title and Gig Score).
+CARD_FIELDS = {
+    'Experience': 'experience',
+    'Structure': 'structure',
+    'Schedule': 'schedule',
+    'Income': 'income',
+    'Autonomy': 'autonomy',
+}
+
+
+@dataclass(frozen=True, slots=True)
+class WorkerProfile:
+    key: str
+    title: str
+    experience: str
+    structure: str
+    schedule: str
+    income: str
+    autonomy: str
+    gig_score: str
+
+    @property
+    def gig_percent(self):
+        """The Gig Score as a percentage: "9/10 (90%)" -> 90.0; NaN if unparseable."""
+        match = _PERCENT.search(self.gig_score)
+        if match:
+            return float(match.group(1))
+        match = _FRACTION.search(self.gig_score)
+        if match and float(match.group(2)):
+            return float(match.group(1)) / float(match.group(2)) * 100
+        return float('nan')
+
+    @property
+    def band(self):
+        percent = self.gig_percent
+        return 'Unscored' if percent != percent else str(classify(percent))
+
+    @property
+    def card_class(self):
+        return f'worker-card-{self.key}' if self.key in CARD_STYLES else 'worker-card-default'
+
+    def render_card(self):
+        def e(text):
+            return html.escape(text, quote=False)
+
+        rows = "".join(
+            f"<p><strong>{label}:</strong> {e(getattr(self, attr))}</p>\n"
+            for label, attr in CARD_FIELDS.items()
+        )
+        return (
+            f'<div class="worker-card {self.card_class}">\n'
+            f"<h3>{e(self.title)}</h3>\n"
+            f"<p><strong>Gig Score:</strong> {e(self.gig_score)}</p>\n"
+            '<hr style="margin: 10px 0; border-color: rgba(255,255,255,0.2);">\n'
+            f"{rows}</div>"
+        )
+
+
+class RosterIndex:
+    """Sort orders and per-facet value codes for a roster, built once.
+
+    For each facet, `codes` holds one small integer per profile, so a filter is
+    a vectorized membership test over integer arrays; the precomputed orders
+    then put the matches in display order without sorting per request.
+    """
+
+    __slots__ = ('orders', 'values', 'codes')
+
+    def __init__(self, profiles):
+        percent = np.array([p.gig_percent for p in profiles], dtype=float)
+        titles = np.array([p.title for p in profiles], dtype=object)
+        self.orders = {
+            'Roster order': np.arange(len(profiles)),
+            'Gig Score (high to low)': np.lexsort((titles, -np.nan_to_num(percent, nan=-1.0))),
+            'Gig Score (low to high)': np.lexsort((titles, np.nan_to_num(percent, nan=np.inf))),
+        }
+        self.values = {}
+        self.codes = {}
+        for label, attr in FACETS.items():
+            column = np.array([getattr(p, attr) for p in profiles], dtype=object)
+            values, codes = np.unique(column, return_inverse=True)
+            self.values[label] = values.tolist()
+            self.codes[label] = codes.astype(np.int32)
+
+    def query(self, selected=None, order='Roster order'):
+        """Roster positions matching every facet in `selected`, in the given order.
+
+        `selected` maps facet labels to accepted values; an empty selection
+        leaves that facet unfiltered.
+        """
+        mask = np.ones(len(self.orders[order]), dtype=bool)
+        for label, accepted in (selected or {}).items():
+            if not accepted:
+                continue
+            wanted = [code for code, value in enumerate(self.values[label]) if value in accepted]
+            mask &= np.isin(self.codes[label], wanted)
+        ordered = self.orders[order]
+        return ordered[mask[ordered]]
+
+
+class Roster:
+    """An immutable sequence of WorkerProfile with memoized card HTML."""
+
+    __slots__ = ('profiles', '_cards', '_index')
+
+    def __init__(self, profiles):
+        self.profiles = tuple(profiles)
+        self._cards = [None] * len(self.profiles)
+        self._index = None
+
+    def __len__(self):
+        return len(self.profiles)
+
+    def __iter__(self):
+        return iter(self.profiles)
+
+    def __getitem__(self, i):
+        return self.profiles[i]
+
+    @property
+    def index(self):
+        if self._index is None:
+            self._index = RosterIndex(self.profiles)
+        return self._index
+
+    def card_html(self, i):
+        # Idempotent, so concurrent sessions filling the same slot is harmless.
+        card = self._cards[i]
+        if card is None:
+            card = self._cards[i] = self.profiles[i].render_card()
+        return card
+
+
+@memoize("roster")
+def _roster(cohort, version):
+    frame = data.load_table('workers', cohort)
+    columns = ['key', 'title', *CARD_FIELDS, 'Gig Score']
+    return Roster(WorkerProfile(*row) for row in frame[columns].itertuples(index=False, name=None))
+
+
+def roster(cohort=None):
+    """The cohort's worker profiles, shared across sessions."""
+    return _roster(cohort, data.table_version('workers', cohort))
@@ -0,0 +1,99 @@
+"""Nearest-profile index over Gig-ness score vectors.
+
+Each dimension score is 0-2, so there are only 3^5 = 243 possible vectors.
+A worker is stored as its base-3 code (one uint8), and everything that depends
+only on the vector - distances, the nearest reference profiles - is
+precomputed per code. Classifying a worker is then a table lookup, and
+cohort-level queries ("how many workers within distance d of Zanzibar")
+only touch the 243-entry code histogram, whatever the number of workers.
+"""
+import numpy as np
+
+from gigness import dimensions, MAX_DIMENSION_SCORE, whole_scores
+
+BASE = MAX_DIMENSION_SCORE + 1
+N_CODES = BASE ** len(dimensions)
+_PLACE = BASE ** np.arange(len(dimensions) - 1, -1, -1)
+
+# Every possible vector, indexed by its code.
+CODEBOOK = ((np.arange(N_CODES)[:, None] // _PLACE) % BASE).astype(np.int8)
+
+# Squared Euclidean distance between every pair of codes (max 4 * 5 = 20).
+SQ_DIST = ((CODEBOOK[:, None, :] - CODEBOOK[None, :, :]).astype(np.int16) ** 2).sum(axis=2).astype(np.uint8)
+
+
+def encode(values):
+    """(n, 5) dimension scores -> (n,) uint8 codes."""
+    # NaN or 1.5 would otherwise map silently to a wrong code.
+    values = whole_scores(values)
+    if values.ndim == 1:
+        values = values.reshape(1, -1)
+    if values.shape[1] != len(dimensions):
+        raise ValueError(f"expected {len(dimensions)} dimension columns, got {values.shape[1]}")
+    if values.min(initial=0) < 0 or values.max(initial=0) > MAX_DIMENSION_SCORE:
+        raise ValueError(f"dimension scores must lie in 0..{MAX_DIMENSION_SCORE}")
+    return (values.astype(np.int16) @ _PLACE).astype(np.uint8)
+
+
+def decode(codes):
+    """Codes -> (n, 5) int8 dimension scores."""
+    return CODEBOOK[np.asarray(codes)]
+
+
+class ProfileIndex:
+    """Reference profiles plus any number of observed workers, stored as codes."""
+
+    def __init__(self, references):
+        self.names = np.array(list(references))
+        self.reference_codes = encode([references[name] for name in self.names])
+        # For each possible code, references ordered nearest first (stable, so
+        # ties go to the earlier reference, as in gigness.nearest_profile).
+        self._ranking = np.argsort(SQ_DIST[:, self.reference_codes], axis=1, kind='stable')
+        self.codes = np.empty(0, dtype=np.uint8)
+        self.counts = np.zeros(N_CODES, dtype=np.int64)
+
+    def __len__(self):
+        return len(self.codes)
+
+    def add(self, values):
+        """Append observed workers' score vectors."""
+        codes = encode(values)
+        self.codes = np.concatenate([self.codes, codes])
+        self.counts += np.bincount(codes, minlength=N_CODES)
+        return self
+
+    @property
+    def vectors(self):
+        return decode(self.codes)
+
+    def _reference(self, name):
+        matches = np.flatnonzero(self.names == name)
+        if not len(matches):
+            raise KeyError(f"unknown reference profile {name!r}")
+        return self.reference_codes[matches[0]]
+
+    # --- per-worker queries: O(1) each ---
+    def nearest(self, values=None, k=1):
+        """Names of the k nearest references for `values` (default: every observed worker)."""
+        codes = self.codes if values is None else encode(values)
+        return self.names[self._ranking[codes, :k]]
+
+    # --- cohort queries: O(243) on the code histogram ---
+    def cohort_sizes(self):
+        """Number of observed workers whose nearest reference is each profile."""
+        sizes = np.bincount(self._ranking[:, 0], weights=self.counts, minlength=len(self.names))
+        return dict(zip(self.names.tolist(), sizes.astype(np.int64).tolist()))
+
+    def count_within(self, name, distance):
+        """Number of observed workers within Euclidean `distance` of a reference."""
+        mask = SQ_DIST[self._reference(name)] <= distance ** 2
+        return int(self.counts[mask].sum())
+
+    def within(self, name, distance):
+        """Positions of the observed workers within `distance` of a reference."""
+        mask = SQ_DIST[self._reference(name)] <= distance ** 2
+        return np.flatnonzero(mask[self.codes])
+
+    def count_matching(self, values):
+        """Number of observed workers with exactly this score vector."""
+        return int(self.counts[encode(values)[0]])
@@ -0,0 +1,153 @@
+"""Saved Gig-ness calculator scenarios.
+
+A scenario is a list of dimension scores, stored as one packed integer: the
+scores as digits of a mixed-radix number, one digit per dimension with radix
+`max - min + 1` (as `profile_index` encodes respondents). For the default
+index that is a base-3 code below 243, so equal scenarios have equal keys and
+deduplication and lookup are dict operations on small ints.
+
+A `ScenarioStore` holds the scenarios for one index spec - a dict of
+code -> name, in the order saved - and lives in the session. With
+`GIG_SCENARIO_DB` set to a file path and an owner given (the dashboard uses the
+signed-in user), every change is also written to a local SQLite database and a
+new session of the same owner starts from what it saved before. Without an
+owner the store is never persisted, so anonymous sessions cannot see or
+delete each other's scenarios.
+"""
+import os
+import re
+import sqlite3
+import threading
+import time
+
+import numpy as np
+
+DB_PATH = os.environ.get("GIG_SCENARIO_DB") or None
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS scenarios (
+    owner TEXT NOT NULL,
+    spec TEXT NOT NULL,
+    code INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    saved REAL NOT NULL,
+    PRIMARY KEY (owner, spec, code)
+) WITHOUT ROWID
+"""
+_db_lock = threading.Lock()
+_DEFAULT_NAME = re.compile(r"Scenario (\d+)")
+
+
+def _connect(path):
+    conn = sqlite3.connect(path)
+    conn.execute(_SCHEMA)
+    return conn
+
+
+class ScenarioStore:
+    """Scenarios of one owner for one index spec, keyed by packed code."""
+
+    __slots__ = ('spec', 'owner', 'db_path', '_mins', '_radices', '_places', '_names', '_numbered')
+
+    def __init__(self, spec, owner=None, db_path=DB_PATH):
+        self.spec = spec
+        self.owner = owner
+        # Only an identified owner's scenarios are persisted.
+        self.db_path = db_path if owner else None
+        self._mins = np.array([d.min for d in spec.dimensions], dtype=np.int64)
+        self._radices = np.array([d.max - d.min + 1 for d in spec.dimensions], dtype=np.int64)
+        if np.prod(self._radices.astype(float)) >= 2 ** 63:
+            raise ValueError(f"{spec.name}: too many score combinations to pack into one integer")
+        # First dimension is the most significant digit.
+        self._places = np.concatenate([np.cumprod(self._radices[::-1])[-2::-1], [1]]).astype(np.int64)
+        self._names = {}
+        # Highest "Scenario N" default name given so far; defaults never repeat after a delete.
+        self._numbered = 0
+        if self.db_path is not None:
+            self._load()
+
+    @property
+    def persistent(self):
+        return self.db_path is not None
+
+    # -- codes -----------------------------------------------------------------
+    def encode(self, scores):
+        """Packed code of one list of dimension scores."""
+        digits = np.asarray(scores, dtype=np.int64) - self._mins
+        if digits.shape != self._mins.shape or (digits < 0).any() or (digits >= self._radices).any():
+            raise ValueError(f"scores {list(scores)} do not fit {self.spec.name}")
+        return int(digits @ self._places)
+
+    def decode(self, codes):
+        """(n, d) dimension scores of an array of codes."""
+        codes = np.asarray(codes, dtype=np.int64).reshape(-1, 1)
+        return (codes // self._places) % self._radices + self._mins
+
+    # -- access ----------------------------------------------------------------
+    def __len__(self):
+        return len(self._names)
+
+    def __contains__(self, code):
+        return code in self._names
+
+    def get(self, code):
+        """(name, scores) of a saved code, or None."""
+        name = self._names.get(code)
+        return None if name is None else (name, self.decode([code])[0].tolist())
+
+    def codes(self):
+        return np.fromiter(self._names, dtype=np.int64, count=len(self._names))
+
+    def names(self):
+        return list(self._names.values())
+
+    def next_name(self):
+        """Default name of the next saved scenario."""
+        return f"Scenario {self._numbered + 1}"
+
+    def matrix(self):
+        """Scores of every saved scenario, in the order saved."""
+        return self.decode(self.codes())
+
+    # -- changes ---------------------------------------------------------------
+    def add(self, scores, name=None):
+        """Save `scores`; returns (code, added) - added is False for a duplicate."""
+        code = self.encode(scores)
+        if code in self._names:
+            return code, False
+        name = name or self.next_name()
+        self._names[code] = name
+        self._note_name(name)
+        self._write("INSERT OR IGNORE INTO scenarios VALUES (?, ?, ?, ?, ?)", [(self.owner, self.spec.digest, code, name, time.time())])
+        return code, True
+
+    def remove(self, codes):
+        codes = [int(c) for c in codes if c in self._names]
+        for code in codes:
+            del self._names[code]
+        self._write("DELETE FROM scenarios WHERE owner = ? AND spec = ? AND code = ?", [(self.owner, self.spec.digest, c) for c in codes])
+
+    def clear(self):
+        self.remove(list(self._names))
+
+    # -- persistence -----------------------------------------------------------
+    def _load(self):
+        with _db_lock, _connect(self.db_path) as conn:
+            rows = conn.execute(
+                "SELECT code, name FROM scenarios WHERE owner = ? AND spec = ? ORDER BY saved",
+                (self.owner, self.spec.digest),
+            ).fetchall()
+        self._names = dict(rows)
+        for name in self._names.values():
+            self._note_name(name)
+
+    def _note_name(self, name):
+        match = _DEFAULT_NAME.fullmatch(name)
+        if match:
+            self._numbered = max(self._numbered, int(match[1]))
+
+    def _write(self, statement, rows):
+        if self.db_path is None or not rows:
+            return
+        with _db_lock, _connect(self.db_path) as conn:
+            conn.executemany(statement, rows)
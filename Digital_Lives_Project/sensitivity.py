@@ -0,0 +1,73 @@
+"""What-if sensitivity of Gig-ness classifications to dimension changes.
+
+For every dimension i and pair (i, j), the sweep moves each worker's score one
+step (up or down, clipped to 0-2) and reports the share of the cohort whose
+classification changes. Nothing is rescored: a worker's new total is their
+current total plus the per-dimension deltas, so a full sweep over n workers is
+15 vectorized additions. Cohorts held as a code histogram (see profile_index)
+are swept over the 243 possible vectors instead, independent of n. Custom
+index specs (see index_spec) are swept the same way with weighted deltas.
+"""
+import numpy as np
+
+from gigness import CLASSIFICATIONS, MAX_DIMENSION_SCORE, MAX_SCORE
+
+# Ascending percent thresholds; class 0 is the lowest (Low Precariousness).
+_THRESHOLDS = np.array(sorted(t for t, _ in CLASSIFICATIONS[:-1]), dtype=float)
+
+
+def class_index(totals):
+    """Classification index (0 = lowest) for an array of total scores."""
+    percent = np.asarray(totals) / MAX_SCORE * 100
+    return np.searchsorted(_THRESHOLDS, percent, side='right')
+
+
+# Totals are small integers, so classifying a moved total is a table lookup.
+_CLASS_OF_TOTAL = class_index(np.arange(MAX_SCORE + 1)).astype(np.int8)
+
+
+def sweep(values, step=1, weights=None, index=None):
+    """Share of the cohort whose classification changes under each perturbation.
+
+    `values` is an (n, d) array of dimension scores, `weights` optional per-row
+    counts, `index` a `CompiledIndex` for a custom spec (default: the Gig-ness
+    Index). Returns a (d, d) symmetric matrix: the diagonal moves one dimension
+    by `step`, off-diagonal cells move both dimensions.
+    """
+    weights = None if weights is None else np.asarray(weights, dtype=float)
+    if index is None:
+        values = np.asarray(values, dtype=np.int8)
+        totals = values.sum(axis=1, dtype=np.int8)
+        # Per-row change in total when one dimension moves by `step`.
+        deltas = np.clip(values + np.int8(step), 0, MAX_DIMENSION_SCORE).astype(np.int8) - values
+        classify = _CLASS_OF_TOTAL.__getitem__
+    else:
+        values = index.matrix(values)
+        totals = values @ index.weights
+        deltas = (np.clip(values + step, index.mins, index.maxs) - values) * index.weights
+
+        def classify(totals):
+            return index.class_index(index.percent(totals))
+
+    n_dims = values.shape[1]
+    total_weight = len(values) if weights is None else weights.sum()
+    if not total_weight:
+        return np.zeros((n_dims, n_dims))
+    current = classify(totals)
+
+    result = np.empty((n_dims, n_dims))
+    for i in range(n_dims):
+        for j in range(i, n_dims):
+            moved = totals + deltas[:, i] + (deltas[:, j] if j != i else 0)
+            changed = classify(moved) != current
+            share = changed.sum() if weights is None else weights @ changed
+            result[i, j] = result[j, i] = share / total_weight
+    return result
+
+
+def sweep_index(index, step=1):
+    """`sweep` over a ProfileIndex's code histogram: O(243) whatever the cohort size."""
+    from profile_index import CODEBOOK
+
+    present = np.flatnonzero(index.counts)
+    return sweep(CODEBOOK[present], step, weights=index.counts[present])
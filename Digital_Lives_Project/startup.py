@@ -0,0 +1,35 @@
+"""Import-time profile of the dashboard process.
+
+Heavy dependencies (pandas, the Plotly figure code) are imported lazily by the
+tabs that need them. Every module loaded through `timed_import` has its first,
+cold import time recorded in IMPORT_TIMES, so the startup cost of each tab
+shows up in the log and in `import_profile()`.
+"""
+import importlib
+import logging
+import sys
+import time
+
+log = logging.getLogger(__name__)
+
+IMPORT_TIMES = {}
+
+
+def timed_import(name):
+    """`importlib.import_module`, timing the first import of `name` in this process."""
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+    start = time.perf_counter()
+    module = importlib.import_module(name)
+    IMPORT_TIMES[name] = time.perf_counter() - start
+    log.info("imported %s in %.1f ms", name, IMPORT_TIMES[name] * 1000)
+    return module
+
+
+def import_profile():
+    """Recorded import times in milliseconds, slowest first."""
+    return {
+        name: round(seconds * 1000, 2)
+        for name, seconds in sorted(IMPORT_TIMES.items(), key=lambda item: -item[1])
+    }
@@ -0,0 +1,170 @@
+"""Precomputed cohort summaries.
+
+A cohort summary holds the figures the sidebar and the Gig-ness tab quote:
+reference profile totals, the respondent count, the per-dimension score
+distribution and the count per classification. Summaries are computed once per
+distinct input and stored as small JSON files under `CACHE_DIR`, named by a
+SHA-256 checksum of the cohort's source files, so the dashboard only reads them
+and a cohort is recomputed only when the content of its inputs changes.
+
+`refresh` recomputes every stale cohort, in parallel on a process pool:
+
+    python summaries.py          # e.g. as a deployment step
+"""
+import hashlib
+import json
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+
+import data
+from analytics_cache import memoize
+from fileio import write_atomic
+from gigness import CLASSIFICATIONS, MAX_DIMENSION_SCORE, MAX_SCORE, dimensions
+
+log = logging.getLogger(__name__)
+
+CACHE_DIR = Path(os.environ.get("GIG_CACHE_DIR", data.DATA_DIR / ".cache" / "summaries"))
+MAX_WORKERS = int(os.environ.get("GIG_SUMMARY_WORKERS", os.cpu_count() or 1))
+
+# Bump when the summary layout or its computation changes.
+SUMMARY_FORMAT = 1
+INPUT_TABLES = ('profile_scores', 'respondents')
+
+# Interview count reported by the study; quoted while a cohort has no respondents table.
+STUDY_SAMPLE_SIZE = 6
+
+
+# -----------------------------------------------------------------------------
+# CHECKSUMS
+# -----------------------------------------------------------------------------
+def input_versions(cohort=None):
+    """(table, path, mtime_ns, size) of every input the cohort actually has."""
+    return tuple((name, *data.table_version(name, cohort)) for name in INPUT_TABLES if data.has_table(name, cohort))
+
+
+@lru_cache(maxsize=64)
+def _checksum(versions):
+    # The versions only key this cache; the digest covers the file contents, so
+    # touching or copying a file does not invalidate its summary.
+    digest = hashlib.sha256(f"summary-v{SUMMARY_FORMAT}".encode())
+    for name, path, _, _ in versions:
+        digest.update(name.encode())
+        with open(path, 'rb') as handle:
+            digest.update(hashlib.file_digest(handle, 'sha256').digest())
+    return digest.hexdigest()
+
+
+def checksum(cohort=None):
+    return _checksum(input_versions(cohort))
+
+
+def cache_path(cohort, digest):
+    return CACHE_DIR / f"{_stem(cohort)}-{digest[:16]}.json"
+
+
+def _stem(cohort):
+    return cohort or '_study'
+
+
+# -----------------------------------------------------------------------------
+# COMPUTATION
+# -----------------------------------------------------------------------------
+def compute(cohort=None):
+    """Summarize one cohort from its tables (imports pandas)."""
+    import numpy as np
+    from gigness import classify
+
+    profiles = data.reference_profiles(cohort)
+    frame = data.respondents(cohort)
+    if frame is not None:
+        basis, values = 'respondents', frame[dimensions].to_numpy(dtype=np.int16)
+    else:
+        basis, values = 'reference profiles', np.array(list(profiles.values()), dtype=np.int16).reshape(-1, len(dimensions))
+
+    labels = classify(values.sum(axis=1) / MAX_SCORE * 100)
+    return {
+        'cohort': cohort,
+        'basis': basis,
+        'respondents': None if frame is None else len(frame),
+        'dimensions': len(dimensions),
+        'reference_totals': {name: int(sum(scores)) for name, scores in profiles.items()},
+        'distribution': {
+            d: np.bincount(values[:, i], minlength=MAX_DIMENSION_SCORE + 1).tolist()
+            for i, d in enumerate(dimensions)
+        },
+        'classifications': {label: int((labels == label).sum()) for _, label in CLASSIFICATIONS},
+    }
+
+
+def _compute_and_store(cohort, digest):
+    """Compute a summary and write it to the cache; runs in a pool worker."""
+    summary = compute(cohort)
+    path = cache_path(cohort, digest)
+    try:
+        write_atomic(path, json.dumps(summary))
+        # Summaries of the cohort's earlier inputs are never read again.
+        for old in CACHE_DIR.glob('*.json'):
+            if old != path and old.stem.rsplit('-', 1)[0] == _stem(cohort):
+                old.unlink(missing_ok=True)
+    except OSError as exc:
+        log.warning("cannot cache summary for %s: %s", cohort or "study sample", exc)
+    return summary
+
+
+def _read_cached(path):
+    try:
+        return json.loads(path.read_text())
+    except (OSError, ValueError):
+        return None
+
+
+# -----------------------------------------------------------------------------
+# ACCESS
+# -----------------------------------------------------------------------------
+@memoize("summary")
+def _summary(cohort, versions):
+    digest = _checksum(versions)
+    cached = _read_cached(cache_path(cohort, digest))
+    return cached if cached is not None else _compute_and_store(cohort, digest)
+
+
+def summary(cohort=None):
+    """The cohort's summary: from memory, else the on-disk cache, else computed."""
+    return _summary(cohort, input_versions(cohort))
+
+
+def refresh(cohorts=None, max_workers=MAX_WORKERS):
+    """Recompute the summaries whose inputs changed; returns the refreshed cohorts."""
+    cohorts = data.cohorts() if cohorts is None else cohorts
+    stale = [(c, checksum(c)) for c in cohorts]
+    stale = [(c, digest) for c, digest in stale if not cache_path(c, digest).is_file()]
+    if len(stale) > 1 and max_workers > 1:
+        with ProcessPoolExecutor(max_workers=min(max_workers, len(stale))) as pool:
+            list(pool.map(_compute_and_store, *zip(*stale)))
+    else:
+        for c, digest in stale:
+            _compute_and_store(c, digest)
+    return [c for c, _ in stale]
+
+
+def quick_stats(cohort=None):
+    """(label, value, delta) for the sidebar's Quick Stats metrics."""
+    result = summary(cohort)
+    totals = result['reference_totals']
+    # The study's own site is the first reference profile.
+    home, total = next(iter(totals.items()))
+    respondents = result['respondents']
+    return [
+        (f"{home} Score", f"{total}/{MAX_SCORE}", f"{total / MAX_SCORE:.0%} Gig-ness"),
+        ("Workers Interviewed", str(STUDY_SAMPLE_SIZE if respondents is None else respondents), None),
+        ("Index Dimensions", str(result['dimensions']), None),
+    ]
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    refreshed = refresh()
+    print(f"refreshed {len(refreshed)} of {len(data.cohorts())} cohort summaries in {CACHE_DIR}")
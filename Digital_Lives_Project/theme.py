@@ -0,0 +1,267 @@
+"""Colour palettes and the compiled dashboard stylesheet.
+
+The stylesheet is theme-independent: every themed value is a CSS variable. It is
+compiled once into `static/dashboard.css` (run `python theme.py`, and checked
+again at startup) and served by Streamlit's static file server, so a rerun
+only sends the short `:root` variable block for the selected theme.
+"""
+from functools import lru_cache
+from pathlib import Path
+
+THEMES = {
+    "Clear Dark Mode": {
+        'bg_color': "#0e1117",
+        'text_color': "#ffffff",
+        'secondary_bg': "#1f2937",
+        'card_shadow': "rgba(0,0,0,0.6)",
+        'chart_grid': "#374151",
+        'border_color': "#374151",
+        'finding_bg': "linear-gradient(135deg, #1f2937 0%, #111827 100%)",
+    },
+    "High Visibility Light Mode": {
+        'bg_color': "#ffffff",
+        'text_color': "#000000",
+        'secondary_bg': "#f3f4f6",
+        'card_shadow': "rgba(0,0,0,0.1)",
+        'chart_grid': "#e5e7eb",
+        'border_color': "#d1d5db",
+        'finding_bg': "linear-gradient(135deg, #f9fafb 0%, #f3f4f6 100%)",
+    },
+}
+
+DEFAULT_THEME = "Clear Dark Mode"
+
+STATIC_DIR = Path(__file__).parent / "static"
+STYLESHEET_PATH = STATIC_DIR / "dashboard.css"
+# Streamlit serves ./static next to the entry script under app/static/.
+STYLESHEET_URL = "app/static/dashboard.css"
+
+STYLESHEET = """\
+.stApp { background-color: var(--bg-color); color: var(--text-color); }
+
+/* Global Text Styling */
+h1, h2, h3, p, span, li, label, .stMetric div {
+    color: var(--text-color) !important;
+}
+
+/* Worker Cards - Always high contrast */
+.worker-card-zanzibar {
+    background: linear-gradient(135deg, #1e3a8a 0%, #3b82f6 100%);
+    border: 3px solid #60a5fa;
+}
+.worker-card-supplemental {
+    background: linear-gradient(135deg, #065f46 0%, #10b981 100%);
+    border: 3px solid #34d399;
+}
+.worker-card-default {
+    background: linear-gradient(135deg, #374151 0%, #6b7280 100%);
+    border: 3px solid #9ca3af;
+}
+.worker-card-dependent {
+    background: linear-gradient(135deg, #991b1b 0%, #ef4444 100%);
+    border: 3px solid #f87171;
+}
+.worker-card {
+    padding: 1.5rem;
+    border-radius: 12px;
+    color: #ffffff !important;
+    box-shadow: 0 8px 16px var(--card-shadow);
+    margin-bottom: 1rem;
+    height: 100%;
+    display: flex;
+    flex-direction: column;
+    overflow: hidden;
+}
+.worker-card h3 { font-size: 1.25rem; margin-bottom: 0.5rem; }
+.worker-card p { font-size: 0.85rem; margin-bottom: 0.25rem; line-height: 1.2; }
+.worker-card strong { font-weight: 700; }
+.worker-card h3, .worker-card p, .worker-card strong {
+    color: #ffffff !important;
+    text-shadow: 1px 1px 2px rgba(0,0,0,0.5);
+}
+
+/* Findings Box */
+.finding-box {
+    background: var(--finding-bg);
+    border-left: 6px solid #3b82f6;
+    border-top: 1px solid var(--border-color);
+    border-right: 1px solid var(--border-color);
+    border-bottom: 1px solid var(--border-color);
+    padding: 2rem;
+    border-radius: 8px;
+    margin-bottom: 1rem;
+    box-shadow: 0 4px 6px var(--card-shadow);
+}
+.finding-box h4 { color: #3b82f6 !important; margin: 0 0 0.5rem 0; }
+.finding-box p { color: var(--text-color) !important; margin: 0; }
+
+/* Lazy tab bar (a horizontal radio styled as a tab bar) */
+.st-key-tab-nav [role="radiogroup"] {
+    gap: 10px;
+}
+.st-key-tab-nav [role="radiogroup"] label {
+    background-color: var(--secondary-bg);
+    border-radius: 4px;
+    padding: 10px 20px;
+    margin: 0;
+}
+.st-key-tab-nav [role="radiogroup"] label > div:first-of-type {
+    display: none;
+}
+.st-key-tab-nav [role="radiogroup"] label:hover,
+.st-key-tab-nav [role="radiogroup"] label:has(input:checked) {
+    background-color: #3b82f6;
+}
+.st-key-tab-nav [role="radiogroup"] label:hover p,
+.st-key-tab-nav [role="radiogroup"] label:has(input:checked) p {
+    color: #ffffff !important;
+}
+
+/* Sidebar Styling */
+section[data-testid="stSidebar"] {
+    background-color: var(--secondary-bg);
+}
+
+/* Expander Styling */
+.streamlit-expanderHeader {
+    background-color: var(--secondary-bg) !important;
+    border-radius: 8px !important;
+}
+
+/* Interactive Explorer Diagram */
+.explorer-container {
+    display: grid;
+    grid-template-columns: 1fr 0.8fr 1fr;
+    grid-template-rows: auto auto;
+    gap: 2rem;
+    align-items: center;
+    padding: 2rem;
+    background: var(--bg-color);
+    border-radius: 12px;
+    position: relative;
+}
+
+.phone-center {
+    grid-column: 2;
+    grid-row: 1 / span 2;
+    justify-self: center;
+    padding: 1rem;
+    background: #6d5dfc;
+    border: 8px solid #332d4a;
+    border-radius: 40px;
+    width: 180px;
+    height: 320px;
+    display: flex;
+    flex-direction: column;
+    justify-content: center;
+    align-items: center;
+    box-shadow: 0 20px 40px rgba(0,0,0,0.5);
+    color: white !important;
+    text-align: center;
+}
+
+.phone-screen {
+    background: white;
+    width: 140px;
+    height: 240px;
+    border-radius: 10px;
+    margin-bottom: 10px;
+    display: flex;
+    flex-direction: column;
+    justify-content: center;
+    align-items: center;
+    color: #332d4a !important;
+}
+
+.satellite-card {
+    background: var(--secondary-bg);
+    border: 1px solid var(--border-color);
+    padding: 1.5rem;
+    border-radius: 12px;
+    box-shadow: 0 4px 6px var(--card-shadow);
+    transition: transform 0.3s ease;
+    height: 100%;
+    min-height: 200px;
+}
+.satellite-card:hover {
+    transform: translateY(-5px);
+    border-color: #3b82f6;
+}
+.satellite-card h4 { margin: 0.5rem 0; font-size: 1.2rem; }
+.satellite-card ul { padding-left: 1.2rem; margin: 0; }
+.satellite-card li { font-size: 0.9rem; margin-bottom: 0.3rem; }
+
+.satellite-icon {
+    font-size: 2rem;
+    margin-bottom: 0.5rem;
+}
+
+.insight-card {
+    padding: 1.5rem;
+    border-radius: 10px;
+    margin-top: 1.5rem;
+    border-left: 5px solid;
+}
+
+@media (max-width: 768px) {
+    .explorer-container {
+        grid-template-columns: 1fr;
+        grid-template-rows: auto;
+    }
+    .phone-center {
+        grid-row: 1;
+        grid-column: 1;
+    }
+}
+"""
+
+
+# -----------------------------------------------------------------------------
+# COMPILATION
+# -----------------------------------------------------------------------------
+def build_stylesheet(path=STYLESHEET_PATH):
+    """Write STYLESHEET to `path` if it is missing or stale. Returns True if written."""
+    path = Path(path)
+    try:
+        if path.read_text(encoding="utf-8") == STYLESHEET:
+            return False
+    except FileNotFoundError:
+        pass
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(STYLESHEET, encoding="utf-8")
+    return True
+
+
+@lru_cache(maxsize=None)
+def stylesheet_available():
+    """Compile the static bundle once per process; False if it cannot be served."""
+    try:
+        build_stylesheet()
+    except OSError:
+        return False
+    try:
+        import streamlit as st
+        return bool(st.get_option("server.enableStaticServing"))
+    except Exception:
+        return False
+
+
+def theme_variables(theme):
+    """The theme's colours as CSS custom properties, for a `:root` rule."""
+    return "".join(f"--{name.replace('_', '-')}: {value};" for name, value in THEMES[theme].items())
+
+
+@lru_cache(maxsize=None)
+def theme_style(theme):
+    """The per-session <style> block: theme variables plus the shared stylesheet.
+
+    Falls back to inlining the precompiled stylesheet when static serving is off.
+    """
+    variables = theme_variables(theme)
+    if stylesheet_available():
+        return f'<style>@import url("{STYLESHEET_URL}"); :root {{ {variables} }}</style>'
+    return f"<style>:root {{ {variables} }}\n{STYLESHEET}</style>"
+
+
+if __name__ == "__main__":
+    print(f"{STYLESHEET_PATH}: {'written' if build_stylesheet() else 'up to date'}")
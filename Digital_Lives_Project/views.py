@@ -0,0 +1,603 @@
+"""Tab renderers for the dashboard.
+
+Each tab is a function of the selected theme and data cohort. `TABS` maps tab titles to their
+renderers so the app executes only the active tab on a rerun; `as_pages` mounts
+the same renderers as Streamlit multipage units.
+
+Plotly figure code and pandas are imported by the tabs that use them, not at
+module import, so the HTML-only tabs never pay for them.
+"""
+import json
+from functools import partial, wraps
+
+import streamlit as st
+
+import data
+import index_spec
+import instrumentation
+import models
+from gigness import MAX_DIMENSION_SCORE
+from startup import timed_import
+
+
+def show_data_error(exc):
+    """Report a missing or unreadable table in place of the section that needs it."""
+    st.error(f"This section cannot be shown: {exc}")
+
+
+def fragment(func):
+    """`st.fragment` that reports a `data.DataSourceError` instead of raising it.
+
+    A fragment's own reruns bypass the app's handler around the active tab.
+    """
+    @wraps(func)
+    def guarded(*args, **kwargs):
+        try:
+            return func(*args, **kwargs)
+        except data.DataSourceError as exc:
+            show_data_error(exc)
+    return st.fragment(guarded)
+
+
+# -----------------------------------------------------------------------------
+# TAB 1: OVERVIEW
+# -----------------------------------------------------------------------------
+CARDS_PER_ROW = 3
+PAGE_SIZES = [6, 12, 24, 48]
+
+
+def render_overview(theme, cohort=None):
+    st.markdown("### Worker Profiles")
+    st.write("Comparison of Zanzibar informal workers with platform gig workers.")
+    
+    workers = models.roster(cohort)
+    positions = range(len(workers))
+    if len(workers) > PAGE_SIZES[0]:
+        positions = roster_page(workers)
+    
+    # Card HTML is rendered once per profile and shared by all sessions, and
+    # only the visible page is formatted and sent.
+    for start in range(0, len(positions), CARDS_PER_ROW):
+        for col, i in zip(st.columns(CARDS_PER_ROW), positions[start:start + CARDS_PER_ROW]):
+            col.markdown(workers.card_html(i), unsafe_allow_html=True)
+
+
+def roster_page(workers):
+    """Filter, sort and paging controls; returns the visible roster positions."""
+    index = workers.index
+    cols = st.columns(len(models.FACETS) + 1)
+    selected = {
+        label: col.multiselect(label, index.values[label], key=f"overview_filter_{label}")
+        for col, label in zip(cols, models.FACETS)
+    }
+    order = cols[-1].selectbox("Sort by", list(index.orders), key="overview_order")
+    matches = index.query(selected, order)
+    
+    c1, c2, c3 = st.columns([1, 1, 2])
+    page_size = c1.selectbox("Cards per page", PAGE_SIZES, index=1, key="overview_page_size")
+    pages = max(1, -(-len(matches) // page_size))
+    # Narrowing the filters can leave the stored page past the end.
+    if st.session_state.get("overview_page", 1) > pages:
+        st.session_state["overview_page"] = pages
+    page = c2.number_input("Page", min_value=1, max_value=pages, value=1, key="overview_page")
+    start = (page - 1) * page_size
+    c3.caption(f"Showing {min(start + 1, len(matches))}–{min(start + page_size, len(matches))} of {len(matches)} workers")
+    return matches[start:start + page_size]
+
+# -----------------------------------------------------------------------------
+# TAB 2: GIG-NESS INDEX
+# -----------------------------------------------------------------------------
+def render_gigness(theme, cohort=None):
+    st.markdown("### The Gig-ness Index Comparison")
+    gigness_calculator(theme, cohort)
+    matched_cohorts(cohort)
+    cohort_summary(cohort)
+
+
+def matched_cohorts(cohort=None):
+    """Respondents per nearest reference profile, from the profile index."""
+    index = data.profile_index(cohort)
+    if index is None:
+        return
+    st.markdown("#### Matched Cohort Sizes")
+    st.caption(f"{len(index)} respondents, each assigned to their nearest reference profile.")
+    sizes = index.cohort_sizes()
+    cols = st.columns(len(sizes) + 1)
+    for col, (name, size) in zip(cols, sizes.items()):
+        col.metric(f"Nearest to {name}", f"{size}", f"{size / max(len(index), 1):.0%}", delta_color="off")
+    # The study's own site is the first reference profile.
+    home = next(iter(sizes))
+    cols[-1].metric(f"Within 1 point of {home}", index.count_within(home, 1))
+
+
+def cohort_summary(cohort=None):
+    """Classification counts and per-dimension score distribution, from the summary cache."""
+    summary = timed_import("summaries").summary(cohort)
+    with st.expander(f"Score distribution ({summary['basis']})"):
+        cols = st.columns(len(summary['classifications']))
+        for col, (label, count) in zip(cols, summary['classifications'].items()):
+            col.metric(label, count)
+        instrumentation.table("score_distribution", {
+            'Dimension': list(summary['distribution']),
+            **{f"Scored {s}": [counts[s] for counts in summary['distribution'].values()] for s in range(MAX_DIMENSION_SCORE + 1)},
+        })
+
+
+# Slider key, default and help for the Gig-ness dimensions; other dimensions of
+# a custom index spec get generated keys.
+DIMENSION_INPUTS = {
+    "Income Uncertainty": ("u_inc", 1, "0: Stable, 2: High Volatility"),
+    "Contractual Security": ("c_sec", 1, "0: Strong Contract, 2: No Contract"),
+    "Income Dependency": ("i_dep", 1, "0: Supplementary, 2: Sole Source"),
+    "Autonomy Over Time": ("a_time", 1, "0: High Control, 2: Algorithmic/Market Control"),
+    "Digital Mediation": ("d_med", 0, "0: Low/Tool-only, 2: Managed by App"),
+}
+
+BOOTSTRAP_RESAMPLES = [1_000, 5_000, 10_000, 50_000, 100_000]
+BOOTSTRAP_CONFIDENCE = [0.8, 0.9, 0.95, 0.99]
+
+# Alert shown for each classification (also used by the static export's calculator).
+CLASSIFICATION_ALERTS = {
+    "Extreme Precarity": ("error", "Classification: **Extreme Precarity** (High Gig-ness)"),
+    "Moderate Gig-ness": ("warning", "Classification: **Moderate Gig-ness**"),
+    "Low Precariousness": ("success", "Classification: **Low Precariousness**"),
+}
+
+
+@fragment
+def gigness_calculator(theme, cohort=None):
+    """Sliders, radar overlay and result; a slider change reruns only this block."""
+    figures = timed_import("figures")
+    spec = index_definition(cohort)
+    index = index_spec.compile_spec(spec)
+    # --- INPUT SECTION ---
+    with st.expander("🧮 Interactive: Calculate Custom Gig-ness Score", expanded=True):
+        st.markdown("#### Input Your Dimensions")
+        st.write(f"Adjust the sliders below to see how different factors affect the {spec.name}.")
+        
+        cols = st.columns(3)
+        per_column = -(-len(spec.dimensions) // len(cols))
+        user_scores = []
+        for i, dimension in enumerate(spec.dimensions):
+            with cols[i // per_column]:
+                user_scores.append(dimension_slider(dimension))
+        
+        total_score, percent_score, classification = index.score_one(user_scores)
+        
+        s1, s2 = st.columns([1, 2])
+        with s1:
+            sensitive = st.toggle("Sensitivity mode", key="sensitivity_mode", help="Show how many classifications flip when one or two dimensions move by a point")
+        with s2:
+            step = st.radio("Direction", [1, -1], key="sensitivity_step", horizontal=True, format_func=lambda s: "+1 point" if s > 0 else "-1 point", disabled=not sensitive)
+        
+        try:
+            store = scenario_store(spec)
+        except ValueError as exc:
+            store, compare = None, False
+            st.caption(f"Saving scenarios is unavailable: {exc}.")
+        if store is not None:
+            n1, n2, n3 = st.columns([2, 1, 1], vertical_alignment="bottom")
+            with n1:
+                name = st.text_input("Scenario name", key="scenario_name", placeholder=store.next_name())
+            with n2:
+                if st.button("💾 Save scenario", key="save_scenario"):
+                    code, added = store.add(user_scores, name.strip() or None)
+                    saved_as = store.get(code)[0]
+                    st.caption(f"Saved as **{saved_as}**." if added else f"Already saved as **{saved_as}**.")
+            with n3:
+                compare = st.toggle("Compare saved", key="scenario_compare", disabled=not len(store), help="Overlay every saved scenario on the radar")
+    
+    st.markdown("---")
+    
+    if sensitive:
+        col1, col_sens, col2 = st.columns([2, 2, 1])
+        with col_sens:
+            sensitivity_panel(theme, user_scores, step, cohort, spec)
+    else:
+        col1, col2 = st.columns([2, 1])
+    
+    with col1:
+        # --- OUTPUT SECTION (CHART) ---
+        # Reference profiles are cached per theme; only the user trace is new.
+        saved = (store.names(), store.matrix()) if compare and store is not None and len(store) else None
+        instrumentation.plotly_chart("radar", figures.radar(theme, user_scores, cohort, spec, saved), use_container_width=True)
+        
+    with col2:
+        # --- OUTPUT SECTION (METRICS) ---
+        st.markdown("#### Your Result")
+        st.metric("Total Gig-ness Score", f"{total_score:g}/{index.max_total:g}", f"{percent_score:.1f}%", delta_color="inverse")
+        
+        kind, message = CLASSIFICATION_ALERTS.get(classification, ("info", f"Classification: **{classification}**"))
+        getattr(st, kind)(message)
+            
+        st.markdown("#### Research Benchmarks")
+        st.info("The Zanzibar average (9/10) closely tracks the Dependent Gig Worker pattern, despite the absence of digital platforms.")
+    
+    if store is not None and len(store):
+        saved_scenarios(store, index)
+
+
+def scenario_store(spec):
+    """The session's saved scenarios for `spec`.
+
+    With GIG_SCENARIO_DB set they persist for the signed-in user; anonymous
+    sessions keep them in memory only. Raises ValueError if the spec's
+    scores cannot be packed.
+    """
+    scenarios = timed_import("scenarios")
+    stores = st.session_state.setdefault("_scenario_stores", {})
+    store = stores.get(spec.digest)
+    if store is None:
+        owner = st.user.get("email") if st.user.get("is_logged_in") else None
+        store = stores[spec.digest] = scenarios.ScenarioStore(spec, owner)
+    return store
+
+
+def _delete_selected_scenarios(store):
+    rows = st.session_state["scenario_table"]["selection"]["rows"]
+    store.remove(store.codes()[rows])
+
+
+def saved_scenarios(store, index):
+    """Table of saved scenarios with their scores; selected rows can be deleted."""
+    matrix = store.matrix()
+    totals, percents, labels = index.evaluate(matrix)
+    with st.expander(f"📚 Saved Scenarios ({len(store)})"):
+        table = {
+            'Scenario': store.names(),
+            **{name: matrix[:, i] for i, name in enumerate(index.names)},
+            'Total': totals,
+            'Percent': percents.round(1),
+            'Classification': labels,
+        }
+        instrumentation.dataframe("scenarios", table, hide_index=True, use_container_width=True, key="scenario_table", on_select="rerun", selection_mode="multi-row")
+        b1, b2 = st.columns(2)
+        with b1:
+            st.button("Delete selected", key="delete_scenarios", on_click=_delete_selected_scenarios, args=(store,))
+        with b2:
+            st.button("Clear all", key="clear_scenarios", on_click=store.clear)
+
+
+def sensitivity_panel(theme, user_scores, step, cohort=None, spec=index_spec.DEFAULT):
+    """Heatmap of reclassification shares for the cohort, or for the user's own profile."""
+    figures = timed_import("figures")
+    sensitivity = timed_import("sensitivity")
+    # Respondent tables hold the Gig-ness dimensions, so a custom spec sweeps the user's profile.
+    index = data.profile_index(cohort) if spec == index_spec.DEFAULT else None
+    if index is not None and len(index):
+        matrix = sensitivity.sweep_index(index, step)
+        caption = f"Share of {len(index)} respondents whose classification changes."
+    else:
+        custom = None if spec == index_spec.DEFAULT else index_spec.compile_spec(spec)
+        matrix = sensitivity.sweep([user_scores], step, index=custom)
+        caption = "100% where the change would move your profile into another classification."
+    instrumentation.plotly_chart("sensitivity_heatmap", figures.sensitivity_heatmap(theme, matrix, step, spec.dimension_names), use_container_width=True)
+    st.caption(caption)
+
+
+def index_definition(cohort=None):
+    """The active index spec: the cohort's `index_spec.json`, or one edited for this session."""
+    try:
+        base = index_spec.for_cohort(cohort)
+    except (OSError, index_spec.IndexSpecError) as exc:
+        st.error(f"Cannot load {index_spec.SPEC_NAME}: {exc}")
+        base = index_spec.DEFAULT
+    spec = base
+    with st.expander("⚙️ Index definition"):
+        text = st.text_area(
+            "Index spec (JSON)", json.dumps(base.to_dict(), indent=2), height=280, key="index_spec_json",
+            help="Dimensions with weights and score ranges, and [percent, label] classification thresholds.",
+        )
+        try:
+            spec = index_spec.parse(text)
+        except index_spec.IndexSpecError as exc:
+            st.error(f"{exc}. Using the {base.name}.")
+        st.button("Reset", key="index_spec_reset", on_click=st.session_state.pop, args=("index_spec_json", None))
+        st.caption(f"{spec.name}: {len(spec.dimensions)} dimensions, maximum score {index_spec.compile_spec(spec).max_total:g}.")
+    return spec
+
+
+def dimension_slider(dimension):
+    """Score input for one spec dimension."""
+    key, default, help = DIMENSION_INPUTS.get(dimension.name, (None, dimension.min, None))
+    if key is None or (dimension.min, dimension.max) != (0, MAX_DIMENSION_SCORE):
+        # The range is part of the key, so editing it starts a fresh widget.
+        key, help = f"dim_{dimension.name}_{dimension.min}_{dimension.max}", None
+    default = min(max(default, dimension.min), dimension.max)
+    return st.slider(dimension.name, dimension.min, dimension.max, default, key=key, help=help)
+
+# -----------------------------------------------------------------------------
+# TAB 3: AUTONOMY & CONTROL
+# -----------------------------------------------------------------------------
+def render_autonomy(theme, cohort=None):
+    st.markdown("### Autonomy & Control Analysis")
+    st.write("Comparative analysis of perceived vs. actual autonomy.")
+    
+    col1, col2 = st.columns([1, 1])
+    
+    with col1:
+        st.markdown("#### Comparison of Control")
+        autonomy_table(cohort)
+    
+    with col2:
+        st.markdown("#### Autonomy Perception Score")
+        autonomy_chart(theme, cohort)
+    
+    st.markdown("#### Key Insight")
+    st.info("**Finding:** While Zanzibar informal workers technically own their means of production (shop/bus), market pressures and high competition enforce a schedule just as rigid as the algorithmic control in dependent gig work.")
+
+
+@fragment
+def autonomy_chart(theme, cohort=None):
+    """Perception bars; with per-worker responses, bootstrap intervals whose settings rerun only this block."""
+    figures = timed_import("figures")
+    if not data.has_table('autonomy_responses', cohort):
+        instrumentation.plotly_chart("autonomy_bar", figures.autonomy_bar(theme, cohort), use_container_width=True)
+        return
+    # Continuous responses are resampled value by value; offer only counts that stay interactive.
+    limit = data.autonomy_resample_limit(cohort)
+    options = [r for r in BOOTSTRAP_RESAMPLES if limit is None or r <= limit] or [max(100, limit // 100 * 100)]
+    c1, c2 = st.columns(2)
+    with c1:
+        resamples = st.select_slider(
+            "Bootstrap resamples", options, 10_000 if 10_000 in options else options[-1],
+            key="bootstrap_resamples", format_func="{:,}".format,
+        )
+    with c2:
+        confidence = st.select_slider("Confidence", BOOTSTRAP_CONFIDENCE, 0.95, key="bootstrap_confidence", format_func="{:.0%}".format)
+    instrumentation.plotly_chart("autonomy_bar", figures.autonomy_bar(theme, cohort, resamples, confidence), use_container_width=True)
+    sizes = data.autonomy_perception(cohort, resamples, confidence)['n']
+    per_bar = f"{sizes.min():,}" if sizes.min() == sizes.max() else f"{sizes.min():,}-{sizes.max():,}"
+    st.caption(f"Means of worker responses with {confidence:.0%} percentile bootstrap intervals; {per_bar} responses per bar."
+               + (f" Continuous responses: at most {limit:,} resamples." if limit is not None else ""))
+
+
+@fragment
+def autonomy_table(cohort=None):
+    """Aggregated comparison grid; selecting a dimension loads its answer breakdown."""
+    grid = data.autonomy_grid(cohort)
+    if data.autonomy_counts(cohort) is None:
+        instrumentation.dataframe("autonomy_comparison", grid, hide_index=True, use_container_width=True)
+        return
+    # Only the aggregate and the selected slice are sent; the answers stay on the server.
+    event = instrumentation.dataframe(
+        "autonomy_comparison", grid, hide_index=True, use_container_width=True,
+        key="autonomy_grid", on_select="rerun", selection_mode="single-row",
+    )
+    rows = event.selection.rows
+    if not rows:
+        st.caption("Most common answer per cohort, with its share of workers. Select a row for the full breakdown.")
+        return
+    dimension = grid.column('Dimension')[rows[0]].as_py()
+    st.markdown(f"##### {dimension}")
+    instrumentation.dataframe(
+        "autonomy_detail", data.autonomy_detail(cohort, dimension), hide_index=True, use_container_width=True,
+        column_config={
+            'cohort': "Cohort", 'answer': "Answer", 'n': "Workers",
+            'share': st.column_config.ProgressColumn("Share", format="percent", min_value=0, max_value=1),
+        },
+    )
+
+# -----------------------------------------------------------------------------
+# TAB 4: ECONOMIC SECURITY
+# -----------------------------------------------------------------------------
+def render_economic_security(theme, cohort=None):
+    st.markdown("### Economic Security & Vulnerability")
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        st.markdown("#### Income Consistency Patterns")
+        income_chart(theme, cohort)
+        
+        volatility = data.income_volatility(cohort)
+        if volatility is not None:
+            st.markdown("#### Income Uncertainty (from earnings logs)")
+            instrumentation.dataframe(
+                "income_volatility",
+                volatility[['n', 'mean', 'cv', 'volatility_score']].rename(columns={
+                    'n': 'Records', 'mean': 'Mean Earnings', 'cv': 'Coeff. of Variation', 'volatility_score': 'Dimension Score (0-2)'
+                }),
+                use_container_width=True
+            )
+        
+    with col2:
+        st.markdown("#### Structural Vulnerabilities")
+        st.markdown("""
+        - **No Institutional Safety Nets**: All three profiles rely on personal savings for health emergencies.
+        - **Equipment Risks**: Small-scale operators (bus/shop) face catastrophic income loss if tools break.
+        - **Platform Dependency**: Gig workers face "Algo-precarity"—sudden changes in incentives or deactivation.
+        """)
+        st.error("Conclusion: 100% of interviewed Zanzibar informal workers had zero insurance cover.")
+
+
+@fragment
+def income_chart(theme, cohort=None):
+    """Income lines; a long earnings log gets a date window that re-fetches detail."""
+    figures = timed_import("figures")
+    window = None
+    daily = data.daily_income(cohort)
+    if daily is not None and not daily.empty and daily['date'].nunique() > figures.PLOT_WIDTH_PX:
+        first, last = daily['date'].iloc[0].date(), daily['date'].iloc[-1].date()
+        window = st.slider("Zoom", first, last, (first, last), key="income_window", format="YYYY-MM-DD")
+        st.caption(f"Downsampled to about {figures.PLOT_WIDTH_PX} points per series; narrow the window for detail.")
+    instrumentation.plotly_chart("income_lines", figures.income_lines(theme, cohort, window), use_container_width=True)
+
+# -----------------------------------------------------------------------------
+# TAB 5: DIGITAL MEDIATION
+# -----------------------------------------------------------------------------
+def render_digital_mediation(theme, cohort=None):
+    st.markdown("### Digital Mediation & Technology")
+    st.write("How technology shapes the workflow and management of labor.")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("#### Platform Gig Work")
+        st.write("Algorithm as Manager: Tasks, pay, and behavior are controlled via the app.")
+        st.progress(1.0)
+        st.caption("100% Algorithmic Management")
+        
+    with col2:
+        st.markdown("#### Zanzibar Informal Work")
+        st.write("Digital as Tool: WhatsApp/Mobile Money used for communication and payments only.")
+        messages = timed_import("messages")
+        mediation = messages.mediation(cohort)
+        if mediation is None or not mediation['messages']:
+            st.progress(messages.STUDY_TOOL_SHARE)
+            st.caption(f"{messages.STUDY_TOOL_SHARE:.0%} Digital Tool Usage (Non-Managerial)")
+        else:
+            share = mediation['tagged'] / mediation['messages']
+            st.progress(share)
+            st.caption(f"{share:.0%} Digital Tool Usage (Non-Managerial): {mediation['tagged']:,} of {mediation['messages']:,} exported messages coordinate work")
+            st.caption(" · ".join(f"{label} {count / mediation['messages']:.0%}" for label, count in mediation['categories'].items()))
+
+# -----------------------------------------------------------------------------
+# TAB 6: KEY FINDINGS
+# -----------------------------------------------------------------------------
+def render_key_findings(theme, cohort=None):
+    st.markdown("### Major Research Findings")
+    
+    c1, c2 = st.columns(2)
+    
+    with c1:
+        st.markdown(f"""
+        <div class="finding-box">
+            <h4>Finding 1: Gig-ness Without Platforms</h4>
+            <p>Zanzibar workers score 90% on Gig-ness Index despite zero platform involvement. This proves precarity is structural, not just technological.</p>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        st.markdown(f"""
+        <div class="finding-box" style="border-left-color: #fbbf24;">
+            <h4 style="color: #fbbf24 !important;">Finding 2: The Time-Poverty Trap</h4>
+            <p>High autonomy in theory but zero autonomy in practice. Workers must work 14+ hours to meet basic survival costs.</p>
+        </div>
+        """, unsafe_allow_html=True)
+        
+    with c2:
+        st.markdown(f"""
+        <div class="finding-box" style="border-left-color: #10b981;">
+            <h4 style="color: #34d399 !important;">Finding 3: Digital Tools != Digital Management</h4>
+            <p>Zanzibar workers use WhatsApp and Mobile Money extensively, yet remain outside the "platform economy" management structures.</p>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        st.markdown(f"""
+        <div class="finding-box" style="border-left-color: #a855f7;">
+            <h4 style="color: #a855f7 !important;">Finding 4: Invisiblized Skills</h4>
+            <p>Informal workers manage complex logistics, customer relations, and financial risks without the branding or support of platforms.</p>
+        </div>
+        """, unsafe_allow_html=True)
+
+    st.markdown(f"""
+    <div class="finding-box" style="border-left-color: #ef4444; background: rgba(153, 27, 27, 0.1);">
+        <h4 style="color: #f87171 !important;">⚠️ Policy Implication</h4>
+        <p>Labor protections must focus on the <b>vulnerability of the condition</b> (the "gig-ness") rather than the <b>method of work</b> (the app). Regulating the gig economy requires a post-platform perspective.</p>
+    </div>
+    """, unsafe_allow_html=True)
+
+
+# -----------------------------------------------------------------------------
+# TAB 7: INTERACTIVE EXPLORER
+# -----------------------------------------------------------------------------
+def render_explorer(theme, cohort=None):
+    st.markdown("""
+### The Mobile Phone as a Primary Workplace
+A conceptual analysis of platform-free gig labor in Zanzibar.
+
+<div class="explorer-container">
+<div class="satellite-card">
+<div class="satellite-icon">📞</div>
+<h4>Phone Calls</h4>
+<p><strong>CUSTOMER ACCESS</strong></p>
+<ul>
+<li>Direct voice communication</li>
+<li>Immediate coordination</li>
+<li>Personal relationships</li>
+</ul>
+</div>
+
+<div class="phone-center">
+<div class="phone-screen">
+<span style="font-size: 3rem;">📱</span>
+</div>
+<p style="font-weight: bold; margin:0;">THE MOBILE PHONE</p>
+<p style="font-size: 0.7rem;">DECENTRALIZED WORKPLACE</p>
+</div>
+
+<div class="satellite-card">
+<div class="satellite-icon">💬</div>
+<h4>WhatsApp</h4>
+<p><strong>WORK COORDINATION</strong></p>
+<ul>
+<li>Order management</li>
+<li>Schedule negotiation</li>
+<li>Customer messaging</li>
+</ul>
+</div>
+
+<div class="satellite-card">
+<div class="satellite-icon">💰</div>
+<h4>Mobile Money</h4>
+<p><strong>PAYMENT SYSTEM</strong></p>
+<ul>
+<li>Instant wage receipt</li>
+<li>No bank required</li>
+<li>Digital transactions</li>
+</ul>
+</div>
+
+<div class="satellite-card">
+<div class="satellite-icon">✅</div>
+<h4>No Algorithm</h4>
+<p><strong>AUTONOMY RETAINED</strong></p>
+<ul>
+<li>Worker sets terms</li>
+<li>No ratings surveillance</li>
+<li>Direct negotiation</li>
+</ul>
+</div>
+</div>
+
+<div style="display: flex; gap: 20px; justify-content: center; margin-top: 1rem; font-size: 0.8rem;">
+<span><span style="color: #10b981;">●</span> <b>Enabling Functions:</b> Tools workers control</span>
+<span><span style="color: #ef4444;">●</span> <b>Structural Risk:</b> Precarity remains</span>
+</div>
+
+<div class="insight-card" style="background: rgba(59, 130, 246, 0.1); border-color: #3b82f6;">
+<h5 style="color: #3b82f6 !important; margin: 0 0 0.5rem 0;">📊 CONCEPTUAL INSIGHT</h5>
+<p style="font-size: 0.95rem;">This figure conceptualizes the phone <b>not as a platform, but as a decentralized workplace</b>. Unlike platform gig work where proprietary apps mediate all interactions and enable algorithmic control, Zanzibar's informal workers use general-purpose communication tools (calls, WhatsApp, mobile money) that <b>they control</b>. The phone enables coordination without <i>controlling</i> the worker.</p>
+</div>
+
+<div class="insight-card" style="background: rgba(251, 191, 36, 0.1); border-color: #fbbf24;">
+<h5 style="color: #fbbf24 !important; margin: 0 0 0.5rem 0;">🔑 KEY THEORETICAL CONTRIBUTION</h5>
+<p style="font-size: 0.95rem;">This diagram visually demonstrates that <b>digital mediation ≠ platform control</b>. Workers can adopt mobile technology for efficiency gains without surrendering autonomy to algorithms. This challenges the assumption that "going digital" necessarily requires platform intermediaries.</p>
+</div>
+
+<div style="margin-top: 2rem; padding: 1rem; background: var(--secondary-bg); border-radius: 8px; text-align: center; font-size: 0.8rem;">
+<p><b>Data Source:</b> Deep ethnographic interviews with informal workers in Zanzibar (Dec 2025 - Jan 2026)</p>
+<p><b>Research Team:</b> Shambhavi & Rohan | Indian Institute of Technology Madras - Zanzibar (IITMZ)</p>
+</div>
+""", unsafe_allow_html=True)
+
+
+# -----------------------------------------------------------------------------
+# TAB REGISTRY
+# -----------------------------------------------------------------------------
+TABS = {
+    "Overview": render_overview,
+    "Gig-ness Index": render_gigness,
+    "Autonomy & Control": render_autonomy,
+    "Economic Security": render_economic_security,
+    "Digital Mediation": render_digital_mediation,
+    "Key Findings": render_key_findings,
+    "Interactive Explorer": render_explorer,
+}
+
+
+def as_pages(theme, cohort=None):
+    """The tab renderers as `st.Page` objects for use with `st.navigation`."""
+    return [
+        st.Page(partial(render, theme, cohort), title=title, url_path=render.__name__.removeprefix("render_"), default=(i == 0))
+        for i, (title, render) in enumerate(TABS.items())
+    ]